@@ -0,0 +1,34 @@
+"""Add script full-text search index
+
+Revision ID: 3f1c9b7d2e4a
+Revises: ac75ea5ef42f
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+from src.models.database import create_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = "3f1c9b7d2e4a"
+down_revision = "ac75ea5ef42f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Shared with init_db, which skips the SQLite index on builds without
+    # the FTS5 trigram tokenizer
+    create_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS scripts_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS scripts_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS scripts_fts_insert")
+        op.execute("DROP TABLE IF EXISTS scripts_fts")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_scripts_fts")
@@ -1,49 +1,189 @@
 #!/usr/bin/env python
 """Download Chatterbox models from HuggingFace for local use."""
 
+import asyncio
+import importlib.util
 import os
+import shutil
 import sys
 from pathlib import Path
 
+# Use the Rust hf_transfer backend when it is installed. This must be set before
+# huggingface_hub is imported, and only when the package exists, otherwise the
+# hub refuses to download at all.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 try:
-    from huggingface_hub import snapshot_download
+    import requests
+    from huggingface_hub import HfApi, constants, hf_hub_download, snapshot_download
 except ImportError:
     print("Please install huggingface_hub: pip install huggingface-hub")
     sys.exit(1)
 
+try:
+    from tenacity import (
+        Retrying,
+        retry,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_exponential,
+    )
+except ImportError:
+    print("Please install tenacity: pip install tenacity")
+    sys.exit(1)
+
+
+DEFAULT_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# Transient network errors. requests' ConnectionError is not the builtin one
+RETRY_ERRORS = (
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+# Retry transient network errors with exponential backoff
+RETRY_POLICY = dict(
+    retry=retry_if_exception_type(RETRY_ERRORS),
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=4, max=30),
+    reraise=True,
+)
+
+# huggingface_hub re-raises hf_transfer failures as RuntimeError
+HF_TRANSFER_RETRY_POLICY = dict(
+    RETRY_POLICY, retry=retry_if_exception_type(RETRY_ERRORS + (RuntimeError,))
+)
+
+
+@retry(**RETRY_POLICY)
+def download_file(model_id: str, filename: str) -> Path:
+    """Download one repo file into the hub cache, resuming partial downloads."""
+    return Path(
+        hf_hub_download(model_id, filename, force_download=False, etag_timeout=30)
+    )
+
+
+async def download_files_parallel(model_id: str, max_workers: int) -> Path:
+    """Download every file of a repo concurrently into the hub cache.
+
+    Used when hf_transfer is not installed, where the number of parallel
+    connections is what limits throughput.
+
+    Args:
+        model_id: HuggingFace model repository ID
+        max_workers: Maximum number of files downloading at once
+
+    Returns:
+        Snapshot directory containing the downloaded files
+    """
+    files = HfApi().list_repo_files(model_id)
+    if not files:
+        raise RuntimeError(f"No files found in {model_id}, check the repo ID and revision")
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch(filename: str) -> Path:
+        async with semaphore:
+            return await asyncio.to_thread(download_file, model_id, filename)
+
+    results = await asyncio.gather(*(fetch(f) for f in files), return_exceptions=True)
+    for filename, result in zip(files, results):
+        if isinstance(result, BaseException):
+            raise RuntimeError(f"Failed to download {filename}: {result}") from result
 
-def download_chatterbox_models(model_id: str = "resemble-ai/chatterbox", local_dir: str = "models/chatterbox"):
+    # Every file lands in the same snapshot directory, so walk back up from any
+    # one of them by the depth of its repo path
+    return results[0].parents[len(Path(files[0]).parts) - 1]
+
+
+def materialize_snapshot(snapshot_path: Path, local_path: Path) -> None:
+    """Hard-link a cached snapshot into a flat directory.
+
+    Snapshot entries are symlinks into the hub's blob store, so linking the
+    resolved blobs is constant time per file instead of a full copy. Falls back
+    to copying when the target is on a different filesystem.
+
+    Args:
+        snapshot_path: Snapshot directory returned by snapshot_download
+        local_path: Directory to populate with regular files
+    """
+    for source in snapshot_path.rglob("*"):
+        if source.is_dir():
+            continue
+        target = local_path / source.relative_to(snapshot_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            target.unlink()
+        blob = source.resolve()
+        try:
+            os.link(blob, target)
+        except OSError:
+            shutil.copy2(blob, target)
+
+
+def download_chatterbox_models(
+    model_id: str = "resemble-ai/chatterbox",
+    local_dir: str = "models/chatterbox",
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    materialize: bool = False,
+):
     """Download Chatterbox models from HuggingFace.
-    
+
+    Files are stored in the shared HuggingFace cache (HF_HOME), which
+    deduplicates content across repos and revisions so re-runs only fetch
+    what changed. Pass ``materialize=True`` to also get a flat copy.
+
     Args:
         model_id: HuggingFace model repository ID
-        local_dir: Local directory to save models
+        local_dir: Local directory for the flat copy when materializing
+        max_workers: Number of files to download in parallel
+        materialize: Hard-link the cached snapshot into local_dir
     """
     local_path = Path(local_dir)
-    local_path.mkdir(parents=True, exist_ok=True)
-    
+
     print(f"Downloading Chatterbox models from {model_id}...")
-    print(f"Saving to: {local_path.absolute()}")
-    
+    print(f"Using HuggingFace cache: {constants.HF_HOME}")
+    use_hf_transfer = os.environ.get("HF_HUB_ENABLE_HF_TRANSFER") == "1"
+    if use_hf_transfer:
+        # hf_transfer does not report progress, so say why the output is quiet
+        print("Using hf_transfer for accelerated downloads (no progress bars)")
+
     try:
-        # Download all model files
-        snapshot_download(
-            repo_id=model_id,
-            local_dir=str(local_path),
-            local_dir_use_symlinks=False,
-            resume_download=True
-        )
-        
-        print(f"\n✅ Models downloaded successfully to: {local_path.absolute()}")
+        if use_hf_transfer:
+            # hf_transfer is fast but occasionally drops connections, so retry
+            # the whole snapshot, completed files are skipped on the next attempt
+            for attempt in Retrying(**HF_TRANSFER_RETRY_POLICY):
+                with attempt:
+                    # Download all model files into the hub cache
+                    snapshot_path = Path(
+                        snapshot_download(
+                            repo_id=model_id,
+                            max_workers=max_workers,
+                            etag_timeout=30,
+                        )
+                    )
+        else:
+            print(f"Downloading files in parallel ({max_workers} at a time)")
+            snapshot_path = asyncio.run(download_files_parallel(model_id, max_workers))
+
+        model_path = snapshot_path
+        if materialize:
+            print(f"Linking snapshot into: {local_path.absolute()}")
+            local_path.mkdir(parents=True, exist_ok=True)
+            materialize_snapshot(snapshot_path, local_path)
+            model_path = local_path
+
+        print(f"\n✅ Models downloaded successfully to: {model_path.absolute()}")
         print("\nTo use these models, set the following environment variables:")
         print(f"export CHATTERBOX_USE_LOCAL_MODELS=true")
-        print(f"export CHATTERBOX_MODEL_PATH={local_path.absolute()}")
-        print(f"export HF_HOME={local_path.parent.absolute()}")
+        print(f"export CHATTERBOX_MODEL_PATH={model_path.absolute()}")
+        print(f"export HF_HOME={constants.HF_HOME}")
         print("\nOr add them to your .env file:")
         print(f"CHATTERBOX_USE_LOCAL_MODELS=true")
-        print(f"CHATTERBOX_MODEL_PATH={local_path.absolute()}")
-        print(f"HF_HOME={local_path.parent.absolute()}")
-        
+        print(f"CHATTERBOX_MODEL_PATH={model_path.absolute()}")
+        print(f"HF_HOME={constants.HF_HOME}")
+
     except Exception as e:
         print(f"\n❌ Error downloading models: {e}")
         sys.exit(1)
@@ -51,7 +191,7 @@ def download_chatterbox_models(model_id: str = "resemble-ai/chatterbox", local_d
 
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Download Chatterbox models for local use")
     parser.add_argument(
         "--model-id",
@@ -61,8 +201,21 @@ if __name__ == "__main__":
     parser.add_argument(
         "--local-dir",
         default="models/chatterbox",
-        help="Local directory to save models (default: models/chatterbox)"
+        help="Local directory for --materialize (default: models/chatterbox)"
     )
-    
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of parallel file downloads (default: {DEFAULT_MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--materialize",
+        action="store_true",
+        help="Hard-link the cached snapshot into --local-dir as regular files"
+    )
+
     args = parser.parse_args()
-    download_chatterbox_models(args.model_id, args.local_dir)
\ No newline at end of file
+    download_chatterbox_models(
+        args.model_id, args.local_dir, args.max_workers, args.materialize
+    )
@@ -37,6 +37,9 @@ def main():
         port=settings.api_port,
         reload=settings.api_reload,
         log_level=settings.log_level.lower(),
+        # Longer than the GUI client's 60 second pool keep-alive, so the
+        # server never closes a connection the client is about to reuse
+        timeout_keep_alive=75,
     )
 
 
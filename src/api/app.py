@@ -1,28 +1,104 @@
 """FastAPI application for ChatterBloke backend."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import text
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
 
 from src.api.routers import llm, script, tts, voice
-from src.models import init_db
+from src.models import get_engine, init_db
+from src.services.job_store import MemoryJobStore, get_job_store
+from src.services.ollama_service import get_ollama_service
 from src.utils.config import get_settings
+from src.workers.tts_worker import run_worker
 
 
 logger = logging.getLogger(__name__)
 
 
+class OutputFiles(StaticFiles):
+    """Static file server for generated audio.
+    
+    Output files get unique timestamped names and are never rewritten, so
+    clients may cache them indefinitely instead of refetching on every play.
+    """
+    
+    def file_response(self, *args, **kwargs) -> Response:
+        """Serve the file with far-future immutable caching."""
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """Gzip API responses, leaving already-compressed audio untouched."""
+    
+    # Paths serving WAV audio, which gzip barely shrinks
+    uncompressed_paths = ("/outputs", "/api/tts/download", "/api/tts/generate/quick")
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.uncompressed_paths):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+@asynccontextmanager
+async def database_lifespan(app: FastAPI):
+    """Create tables and open the first pooled database connection."""
+    init_db()
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+    yield
+
+
+@asynccontextmanager
+async def ollama_lifespan(app: FastAPI):
+    """Open the Ollama connection so the first LLM request skips the handshake."""
+    ollama = get_ollama_service()
+    await ollama.ping()
+    yield
+    await ollama.close()
+
+
+@asynccontextmanager
+async def job_store_lifespan(app: FastAPI):
+    """Run the in-process TTS worker when there is no shared queue.
+    
+    With Redis configured, jobs are consumed by separate worker processes.
+    """
+    jobs = get_job_store()
+    worker = None
+    if isinstance(jobs, MemoryJobStore):
+        worker = asyncio.create_task(run_worker(jobs))
+    yield
+    if worker is not None:
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+    await jobs.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan manager."""
+    """Application lifespan manager.
+    
+    Each resource has its own lifespan so new ones can be composed in here
+    without touching the others.
+    """
     # Startup
     logger.info("Starting ChatterBloke API")
-    init_db()
-    yield
+    async with database_lifespan(app), ollama_lifespan(app), job_store_lifespan(app):
+        yield
     # Shutdown
     logger.info("Shutting down ChatterBloke API")
 
@@ -36,17 +112,24 @@ def create_app() -> FastAPI:
         description="Voice cloning and text-to-speech API",
         version=settings.app_version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Configure CORS
+    # Explicit lists let Starlette build the preflight headers once, and a
+    # long max_age lets browsers cache preflights instead of repeating them
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+        max_age=86400,
     )
     
+    # Compress JSON responses, list endpoints shrink several times over
+    app.add_middleware(APIGZipMiddleware, minimum_size=500)
+    
     # Include routers
     app.include_router(voice.router, prefix="/api/voices", tags=["voices"])
     app.include_router(script.router, prefix="/api/scripts", tags=["scripts"])
@@ -56,7 +139,7 @@ def create_app() -> FastAPI:
     # Mount static files for audio outputs
     outputs_dir = settings.outputs_dir
     if outputs_dir.exists():
-        app.mount("/outputs", StaticFiles(directory=str(outputs_dir)), name="outputs")
+        app.mount("/outputs", OutputFiles(directory=str(outputs_dir)), name="outputs")
     
     @app.get("/")
     async def root():
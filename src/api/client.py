@@ -1,12 +1,13 @@
 """API client for frontend-backend communication."""
 
-import json
+import asyncio
 import logging
+import mimetypes
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-from httpx import HTTPStatusError
+import aiohttp
+import orjson
 
 from src.api.models import (
     ScriptCreate,
@@ -15,6 +16,8 @@ from src.api.models import (
     VoiceProfileCreate,
     VoiceProfileResponse,
     VoiceProfileUpdate,
+    script_list_adapter,
+    voice_profile_list_adapter,
 )
 from src.utils.config import get_settings
 
@@ -22,8 +25,101 @@ from src.utils.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+class TTSStatusBatcher:
+    """Coalesce concurrent TTS status checks into batched requests.
+    
+    Status checks queued within ``max_queue_time`` seconds (or until
+    ``max_batch_size`` distinct jobs are waiting) are sent as a single
+    ``POST /api/tts/status/batch`` call.
+    """
+    
+    def __init__(
+        self,
+        client: "APIClient",
+        max_batch_size: int = 32,
+        max_queue_time: float = 0.05,
+        concurrency: int = 4,
+    ):
+        """Initialize the batcher.
+        
+        Args:
+            client: API client used to send batch requests
+            max_batch_size: Maximum number of job IDs per request
+            max_queue_time: Seconds to wait for more checks before sending
+            concurrency: Maximum number of batch requests in flight
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self.concurrency = concurrency
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: set = set()
+        
+    async def process(self, job_id: str) -> Dict[str, Any]:
+        """Queue a status check and wait for its batched result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(job_id, []).append(future)
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush)
+            
+        return await future
+        
+    def _flush(self) -> None:
+        """Send all pending status checks as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._process_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            
+    async def _process_batch(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        """Fetch statuses for a batch and resolve the waiting futures."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            
+        try:
+            async with self._semaphore:
+                result = await self.client._request(
+                    "POST",
+                    "/api/tts/status/batch",
+                    json={"job_ids": list(batch)},
+                    timeout=aiohttp.ClientTimeout(total=10.0),
+                )
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+            
+        statuses = result.get("statuses", {})
+        for job_id, futures in batch.items():
+            status = statuses.get(job_id)
+            for future in futures:
+                if future.done():
+                    continue
+                if status is None:
+                    future.set_exception(Exception("API error: Job not found"))
+                else:
+                    future.set_result(status)
+
+
 class APIClient:
-    """Client for ChatterBloke API."""
+    """Client for ChatterBloke API.
+    
+    The client owns a pooled HTTP session, so share one instance via
+    get_api_client() rather than creating APIClient per call or in a loop.
+    """
     
     def __init__(self, base_url: Optional[str] = None):
         """Initialize API client.
@@ -33,44 +129,87 @@ class APIClient:
         """
         self.settings = get_settings()
         self.base_url = base_url or self.settings.api_url
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(30.0, read=300.0),  # 5 minute read timeout for long operations
-        )
+        # The session is bound to the event loop it is created in, so it is
+        # built lazily on first use from inside the client's loop
+        self.client: Optional[aiohttp.ClientSession] = None
+        self._status_batcher = TTSStatusBatcher(self)
+        # path -> (ETag, payload) for resources that support revalidation
+        self._etag_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating it on first use."""
+        if self.client is None or self.client.closed:
+            # Idle connections are kept for a minute, so lines generated a
+            # few seconds apart reuse one instead of reconnecting. This must
+            # stay below the server's keep-alive timeout in run_api.py
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self.client = aiohttp.ClientSession(
+                base_url=self.base_url,
+                connector=connector,
+                # aiohttp decodes these transparently, br needs the brotli package
+                headers={"Accept-Encoding": "gzip, deflate, br"},
+                # No overall cap, CPU synthesis takes minutes, but each read
+                # may stall for 5 minutes at most and connecting fails fast
+                # when the server is not there at all. Quick calls such as
+                # health and status checks pass their own short timeouts
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=300),
+            )
+        return self.client
         
     async def close(self) -> None:
         """Close the HTTP client."""
-        await self.client.aclose()
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
         
-    async def _handle_response(self, response: httpx.Response) -> Any:
+    async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
         """Handle API response and errors."""
-        try:
-            response.raise_for_status()
-            return response.json()
-        except HTTPStatusError as e:
+        if response.status >= 400:
             error_detail = "Unknown error"
             try:
-                error_data = e.response.json()
+                error_data = orjson.loads(await response.read())
                 error_detail = error_data.get("detail", error_detail)
             except:
                 pass
-            logger.error(f"API error: {e.response.status_code} - {error_detail}")
+            logger.error(f"API error: {response.status} - {error_detail}")
             raise Exception(f"API error: {error_detail}")
+        return orjson.loads(await response.read())
             
     async def _request(
         self, method: str, path: str, **kwargs
     ) -> dict:
         """Make a generic request to the API."""
-        response = await self.client.request(method, path, **kwargs)
-        return await self._handle_response(response)
+        session = await self.get_session()
+        async with session.request(method, path, **kwargs) as response:
+            return await self._handle_response(response)
+            
+    async def _get_revalidated(self, path: str) -> dict:
+        """GET a resource, reusing the cached payload when it is unchanged."""
+        cached = self._etag_cache.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        session = await self.get_session()
+        async with session.get(path, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached[1]
+            result = await self._handle_response(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[path] = (etag, result)
+            return result
             
     # Health check
     async def health_check(self) -> bool:
         """Check if API is healthy."""
         try:
             # Use a shorter timeout for health checks to avoid blocking
-            response = await self.client.get("/health", timeout=5.0)
-            data = await self._handle_response(response)
+            data = await self._request(
+                "GET", "/health", timeout=aiohttp.ClientTimeout(total=5.0)
+            )
             return data.get("status") == "healthy"
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -80,6 +219,9 @@ class APIClient:
     async def upload_audio_file(self, file_path: Path) -> Dict[str, Any]:
         """Upload an audio file.
         
+        The file is streamed from disk as the request body is sent rather
+        than read into memory first.
+        
         Args:
             file_path: Path to audio file
             
@@ -87,9 +229,14 @@ class APIClient:
             Upload response with file details
         """
         with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "audio/wav")}
-            response = await self.client.post("/api/voices/upload", files=files)
-            return await self._handle_response(response)
+            data = aiohttp.FormData()
+            data.add_field(
+                "file",
+                f,
+                filename=file_path.name,
+                content_type=mimetypes.guess_type(file_path.name)[0] or "audio/wav",
+            )
+            return await self._request("POST", "/api/voices/upload", data=data)
             
     async def create_voice_profile(
         self,
@@ -105,28 +252,27 @@ class APIClient:
             description=description,
             parameters=parameters or {},
         )
-        response = await self.client.post(
+        result = await self._request(
+            "POST",
             "/api/voices/",
             json=data.model_dump(),
         )
-        result = await self._handle_response(response)
         return VoiceProfileResponse(**result)
         
     async def list_voice_profiles(
         self, skip: int = 0, limit: int = 100
     ) -> List[VoiceProfileResponse]:
         """List all voice profiles."""
-        response = await self.client.get(
+        result = await self._request(
+            "GET",
             "/api/voices/",
             params={"skip": skip, "limit": limit},
         )
-        result = await self._handle_response(response)
-        return [VoiceProfileResponse(**p) for p in result["data"]]
+        return voice_profile_list_adapter.validate_python(result["data"])
         
     async def get_voice_profile(self, voice_id: int) -> VoiceProfileResponse:
         """Get a specific voice profile."""
-        response = await self.client.get(f"/api/voices/{voice_id}")
-        result = await self._handle_response(response)
+        result = await self._get_revalidated(f"/api/voices/{voice_id}")
         return VoiceProfileResponse(**result)
         
     async def update_voice_profile(
@@ -142,17 +288,17 @@ class APIClient:
             description=description,
             parameters=parameters,
         )
-        response = await self.client.put(
+        result = await self._request(
+            "PUT",
             f"/api/voices/{voice_id}",
             json=data.model_dump(exclude_unset=True),
         )
-        result = await self._handle_response(response)
         return VoiceProfileResponse(**result)
         
     async def delete_voice_profile(self, voice_id: int) -> bool:
         """Delete a voice profile."""
-        response = await self.client.delete(f"/api/voices/{voice_id}")
-        result = await self._handle_response(response)
+        self._etag_cache.pop(f"/api/voices/{voice_id}", None)
+        result = await self._request("DELETE", f"/api/voices/{voice_id}")
         return result.get("success", False)
         
     # Script methods
@@ -161,11 +307,11 @@ class APIClient:
     ) -> ScriptResponse:
         """Create a new script."""
         data = ScriptCreate(title=title, content=content)
-        response = await self.client.post(
+        result = await self._request(
+            "POST",
             "/api/scripts/",
             json=data.model_dump(),
         )
-        result = await self._handle_response(response)
         return ScriptResponse(**result)
         
     async def list_scripts(
@@ -176,14 +322,12 @@ class APIClient:
         if search:
             params["search"] = search
             
-        response = await self.client.get("/api/scripts/", params=params)
-        result = await self._handle_response(response)
-        return [ScriptResponse(**s) for s in result["data"]]
+        result = await self._request("GET", "/api/scripts/", params=params)
+        return script_list_adapter.validate_python(result["data"])
         
     async def get_script(self, script_id: int) -> ScriptResponse:
         """Get a specific script."""
-        response = await self.client.get(f"/api/scripts/{script_id}")
-        result = await self._handle_response(response)
+        result = await self._get_revalidated(f"/api/scripts/{script_id}")
         return ScriptResponse(**result)
         
     async def update_script(
@@ -194,22 +338,23 @@ class APIClient:
     ) -> ScriptResponse:
         """Update a script."""
         data = ScriptUpdate(title=title, content=content)
-        response = await self.client.put(
+        result = await self._request(
+            "PUT",
             f"/api/scripts/{script_id}",
             json=data.model_dump(exclude_unset=True),
         )
-        result = await self._handle_response(response)
         return ScriptResponse(**result)
         
     async def delete_script(
         self, script_id: int, delete_versions: bool = False
     ) -> bool:
         """Delete a script."""
-        response = await self.client.delete(
+        self._etag_cache.pop(f"/api/scripts/{script_id}", None)
+        result = await self._request(
+            "DELETE",
             f"/api/scripts/{script_id}",
-            params={"delete_versions": delete_versions},
+            params={"delete_versions": str(delete_versions).lower()},
         )
-        result = await self._handle_response(response)
         return result.get("success", False)
         
     # TTS methods
@@ -224,7 +369,8 @@ class APIClient:
         Returns:
             Job information including job_id and status
         """
-        response = await self.client.post(
+        return await self._request(
+            "POST",
             "/api/tts/generate",
             json={
                 "text": text,
@@ -232,18 +378,49 @@ class APIClient:
                 "parameters": parameters or {},
             },
         )
-        return await self._handle_response(response)
         
     async def check_tts_status(self, job_id: str) -> Dict[str, Any]:
-        """Check TTS job status."""
-        response = await self.client.get(f"/api/tts/status/{job_id}")
-        return await self._handle_response(response)
+        """Check TTS job status.
+        
+        Concurrent checks are coalesced into a single batch request.
+        """
+        return await self._status_batcher.process(job_id)
+        
+    async def wait_tts_status(self, job_id: str, wait: float = 25) -> Dict[str, Any]:
+        """Long-poll a TTS job until its status changes or ``wait`` runs out.
+        
+        The request times out 10 seconds after ``wait`` runs out.
+        """
+        return await self._request(
+            "GET",
+            f"/api/tts/status/{job_id}",
+            params={"wait": wait},
+            timeout=aiohttp.ClientTimeout(total=wait + 10.0),
+        )
         
-    async def download_tts_audio(self, job_id: str) -> bytes:
-        """Download generated TTS audio."""
-        response = await self.client.get(f"/api/tts/download/{job_id}")
-        response.raise_for_status()
-        return response.content
+    async def download_tts_audio(
+        self, job_id: str, dest: Path, chunk_size: int = 512 * 1024
+    ) -> Path:
+        """Download generated TTS audio to a file.
+        
+        The audio is streamed to disk in chunks instead of being held in
+        memory.
+        
+        Args:
+            job_id: TTS job ID
+            dest: Path to write the audio to
+            chunk_size: Bytes read from the response per write
+            
+        Returns:
+            The destination path
+        """
+        session = await self.get_session()
+        async with session.get(f"/api/tts/download/{job_id}") as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+        return dest
         
     # LLM methods
     async def generate_script_with_llm(
@@ -255,7 +432,8 @@ class APIClient:
         max_tokens: Optional[int] = None,
     ) -> str:
         """Generate script content using LLM."""
-        response = await self.client.post(
+        result = await self._request(
+            "POST",
             "/api/llm/generate",
             json={
                 "prompt": prompt,
@@ -265,7 +443,6 @@ class APIClient:
                 "max_tokens": max_tokens,
             },
         )
-        result = await self._handle_response(response)
         return result["result"]
         
     async def improve_script_with_llm(
@@ -276,7 +453,8 @@ class APIClient:
         temperature: float = 0.7,
     ) -> str:
         """Improve script content using LLM."""
-        response = await self.client.post(
+        result = await self._request(
+            "POST",
             "/api/llm/improve",
             json={
                 "script": script,
@@ -285,11 +463,21 @@ class APIClient:
                 "temperature": temperature,
             },
         )
-        result = await self._handle_response(response)
         return result["result"]
         
     async def list_llm_models(self) -> List[str]:
         """List available LLM models."""
-        response = await self.client.get("/api/llm/models")
-        result = await self._handle_response(response)
-        return result["models"]
\ No newline at end of file
+        result = await self._request("GET", "/api/llm/models")
+        return result["models"]
+
+
+# Global API client instance
+_api_client: Optional[APIClient] = None
+
+
+def get_api_client() -> APIClient:
+    """Get or create the global API client instance."""
+    global _api_client
+    if _api_client is None:
+        _api_client = APIClient()
+    return _api_client
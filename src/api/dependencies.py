@@ -1,5 +1,6 @@
 """API dependencies for dependency injection."""
 
 from src.models.database import get_db
+from src.services.job_store import get_job_store
 
-__all__ = ["get_db"]
\ No newline at end of file
+__all__ = ["get_db", "get_job_store"]
\ No newline at end of file
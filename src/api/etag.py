@@ -0,0 +1,19 @@
+"""ETag helpers for conditional GET requests."""
+
+from typing import Any
+
+from fastapi import Request
+
+
+def make_etag(record: Any) -> str:
+    """Build a weak ETag from a record's ID and last update time."""
+    return f'W/"{record.id}-{int(record.updated_at.timestamp() * 1_000_000)}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
@@ -4,7 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # Base models
@@ -48,9 +48,7 @@ class VoiceProfileResponse(VoiceProfileBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VoiceProfileListResponse(BaseResponse):
@@ -60,6 +58,10 @@ class VoiceProfileListResponse(BaseResponse):
     total: int
 
 
+# Built once so list endpoints reuse the compiled schema for every row
+voice_profile_list_adapter = TypeAdapter(List[VoiceProfileResponse])
+
+
 # Script models
 class ScriptBase(BaseModel):
     """Base script model."""
@@ -90,9 +92,7 @@ class ScriptResponse(ScriptBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ScriptListResponse(BaseResponse):
@@ -102,6 +102,10 @@ class ScriptListResponse(BaseResponse):
     total: int
 
 
+# Built once so list endpoints reuse the compiled schema for every row
+script_list_adapter = TypeAdapter(List[ScriptResponse])
+
+
 # TTS models
 class TTSRequest(BaseModel):
     """Text-to-speech request model."""
@@ -128,6 +132,18 @@ class TTSStatusResponse(BaseResponse):
     error: Optional[str] = None
 
 
+class TTSBatchStatusRequest(BaseModel):
+    """Batch TTS status request model."""
+    
+    job_ids: List[str] = Field(..., min_length=1)
+
+
+class TTSBatchStatusResponse(BaseResponse):
+    """Batch TTS status response model. Unknown job IDs are omitted."""
+    
+    statuses: Dict[str, TTSStatusResponse]
+
+
 # Audio output models
 class AudioOutputResponse(BaseModel):
     """Audio output response model."""
@@ -139,9 +155,7 @@ class AudioOutputResponse(BaseModel):
     parameters: Dict[str, Any]
     created_at: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # LLM models
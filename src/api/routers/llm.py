@@ -3,7 +3,7 @@
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from src.api.models import (
     LLMGenerateRequest,
@@ -12,24 +12,31 @@ from src.api.models import (
     ModelListResponse,
 )
 from src.services.ollama_service import get_ollama_service
-from src.utils.config import get_settings
+from src.utils.config import Settings, get_settings
 
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+
+def _count_tokens(text: str, eval_count: int) -> int:
+    """Use Ollama's token count, approximating by whitespace if it is missing."""
+    if eval_count:
+        return eval_count
+    return text.count(" ") + (1 if text else 0)
 
 
 @router.post("/generate", response_model=LLMResponse)
 async def generate_script_content(
     request: LLMGenerateRequest,
+    settings: Settings = Depends(get_settings),
 ) -> LLMResponse:
     """Generate script content using LLM."""
     logger.info(f"LLM generate request: {request.prompt[:50]}...")
     
     try:
         ollama = get_ollama_service()
-        result = await ollama.generate_script(
+        result, eval_count = await ollama.generate_script(
             prompt=request.prompt,
             script_type=request.script_type or "general",
             model=request.model,
@@ -41,7 +48,7 @@ async def generate_script_content(
             success=True,
             result=result,
             model=request.model or settings.ollama_model,
-            tokens_used=len(result.split()),  # Approximate token count
+            tokens_used=_count_tokens(result, eval_count),
         )
     except Exception as e:
         logger.error(f"Failed to generate script: {e}")
@@ -51,13 +58,14 @@ async def generate_script_content(
 @router.post("/improve", response_model=LLMResponse)
 async def improve_existing_script(
     request: LLMImproveRequest,
+    settings: Settings = Depends(get_settings),
 ) -> LLMResponse:
     """Improve an existing script using LLM."""
     logger.info(f"LLM improve request for script of length: {len(request.script)}")
     
     try:
         ollama = get_ollama_service()
-        result = await ollama.improve_script(
+        result, eval_count = await ollama.improve_script(
             script=request.script,
             instructions=request.instructions,
             model=request.model,
@@ -68,7 +76,7 @@ async def improve_existing_script(
             success=True,
             result=result,
             model=request.model or settings.ollama_model,
-            tokens_used=len(result.split()),  # Approximate token count
+            tokens_used=_count_tokens(result, eval_count),
         )
     except Exception as e:
         logger.error(f"Failed to improve script: {e}")
@@ -76,7 +84,9 @@ async def improve_existing_script(
 
 
 @router.get("/models", response_model=ModelListResponse)
-async def list_available_models() -> ModelListResponse:
+async def list_available_models(
+    settings: Settings = Depends(get_settings),
+) -> ModelListResponse:
     """List available LLM models."""
     try:
         ollama = get_ollama_service()
@@ -3,14 +3,17 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
+from src.api.etag import etag_matches, make_etag
 from src.api.models import (
     ScriptCreate,
     ScriptListResponse,
     ScriptResponse,
     ScriptUpdate,
+    script_list_adapter,
 )
 from src.models import crud, get_db
 
@@ -20,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/", response_model=ScriptResponse)
-async def create_script(
+def create_script(
     script_data: ScriptCreate,
     db: Session = Depends(get_db),
 ) -> ScriptResponse:
@@ -38,7 +41,7 @@ async def create_script(
 
 
 @router.get("/", response_model=ScriptListResponse)
-async def list_scripts(
+def list_scripts(
     skip: int = 0,
     limit: int = 100,
     search: str = Query(None, description="Search in title or content"),
@@ -46,24 +49,30 @@ async def list_scripts(
 ) -> ScriptListResponse:
     """List all scripts with optional search."""
     if search:
-        scripts = crud.script.search(db, query=search)
-        # Apply pagination to search results
-        total = len(scripts)
-        scripts = scripts[skip : skip + limit]
+        scripts, total = crud.script.search(db, query=search, skip=skip, limit=limit)
     else:
-        scripts = crud.script.get_multi(db, skip=skip, limit=limit)
-        total = db.query(crud.script.model).count()
+        scripts, total = crud.script.get_multi(
+            db, skip=skip, limit=limit, with_total=True
+        )
     
-    return ScriptListResponse(
-        success=True,
-        data=scripts,
-        total=total,
+    # Serialize rows directly with the cached adapter; returning a response
+    # skips FastAPI validating the whole list a second time
+    rows = script_list_adapter.validate_python(scripts, from_attributes=True)
+    return ORJSONResponse(
+        content={
+            "success": True,
+            "message": None,
+            "data": script_list_adapter.dump_python(rows, mode="json"),
+            "total": total,
+        }
     )
 
 
 @router.get("/{script_id}", response_model=ScriptResponse)
-async def get_script(
+def get_script(
     script_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ) -> ScriptResponse:
     """Get a specific script."""
@@ -71,11 +80,17 @@ async def get_script(
     if not script:
         raise HTTPException(status_code=404, detail="Script not found")
     
+    # Let clients revalidate a cached copy without resending the body
+    etag = make_etag(script)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     return script
 
 
 @router.get("/{script_id}/versions", response_model=List[ScriptResponse])
-async def get_script_versions(
+def get_script_versions(
     script_id: int,
     db: Session = Depends(get_db),
 ) -> List[ScriptResponse]:
@@ -98,7 +113,7 @@ async def get_script_versions(
 
 
 @router.put("/{script_id}", response_model=ScriptResponse)
-async def update_script(
+def update_script(
     script_id: int,
     script_update: ScriptUpdate,
     db: Session = Depends(get_db),
@@ -117,7 +132,7 @@ async def update_script(
 
 
 @router.post("/{script_id}/version", response_model=ScriptResponse)
-async def create_script_version(
+def create_script_version(
     script_id: int,
     content: str,
     db: Session = Depends(get_db),
@@ -135,7 +150,7 @@ async def create_script_version(
 
 
 @router.delete("/{script_id}")
-async def delete_script(
+def delete_script(
     script_id: int,
     delete_versions: bool = Query(False, description="Delete all versions"),
     db: Session = Depends(get_db),
@@ -147,10 +162,8 @@ async def delete_script(
     
     # If delete_versions is True and this is a parent, delete all versions
     if delete_versions and script.parent_id is None:
-        versions = crud.script.get_versions(db, parent_id=script.id)
-        for version in versions:
-            crud.script.delete(db, id=version.id)
-            logger.info(f"Deleted script version: {version.title} v{version.version} (ID: {version.id})")
+        deleted = crud.script.delete_versions(db, parent_id=script.id)
+        logger.info(f"Deleted {deleted} versions of script: {script.title} (ID: {script.id})")
     
     # Delete the script
     crud.script.delete(db, id=script_id)
@@ -160,7 +173,7 @@ async def delete_script(
 
 
 @router.post("/{script_id}/improve")
-async def improve_script(
+def improve_script(
     script_id: int,
     instructions: str = Query(..., description="Instructions for improvement"),
     db: Session = Depends(get_db),
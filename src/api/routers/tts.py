@@ -1,24 +1,34 @@
 """Text-to-Speech API endpoints."""
 
+import hashlib
+import io
 import logging
 import uuid
 from datetime import datetime
+from email.utils import formatdate
 from pathlib import Path
 from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse, JSONResponse
+import soundfile as sf
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from src.api.dependencies import get_db
+from src.api.dependencies import get_db, get_job_store
+from src.api.etag import etag_matches
 from src.api.models import (
+    TTSBatchStatusRequest,
+    TTSBatchStatusResponse,
     TTSJobResponse,
     TTSRequest,
     TTSStatusResponse,
 )
-from src.models import VoiceProfile, crud
+from src.models import VoiceProfile
+from src.services.job_store import TERMINAL_STATUSES, JobStore
 from src.services.tts_service import get_tts_service
+from src.services.voice_profile_cache import get_voice_profile_cache
 from src.utils.config import get_settings
 
 
@@ -27,15 +37,25 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-# In-memory job tracking (replace with Redis or database in production)
-tts_jobs = {}
+# Generated audio below this size is returned inline instead of streamed
+INLINE_AUDIO_MAX_SIZE = 64 * 1024
+
+# Seconds before an unfinished voice clone stops blocking new ones
+CLONE_LOCK_TTL = 3600
+
+
+class AudioFileResponse(FileResponse):
+    """File response that sends audio in 512 KB chunks instead of 64 KB."""
+    
+    chunk_size = 512 * 1024
 
 
 @router.post("/clone")
 async def clone_voice(
     voice_profile_id: int = Form(...),
-    db: Session = Depends(get_db)
-) -> JSONResponse:
+    db: Session = Depends(get_db),
+    jobs: JobStore = Depends(get_job_store),
+) -> ORJSONResponse:
     """Start voice cloning process for a voice profile."""
     # Get voice profile
     voice_profile = db.query(VoiceProfile).filter_by(id=voice_profile_id).first()
@@ -55,26 +75,41 @@ async def clone_voice(
             status_code=404,
             detail=f"Audio file not found: {audio_path}"
         )
+    
+    # Only one clone per voice profile at a time, the lock is released when
+    # the clone finishes or after CLONE_LOCK_TTL if it never reports back
+    lock_name = f"clone:lock:{voice_profile_id}"
+    if not await jobs.acquire_lock(lock_name, CLONE_LOCK_TTL):
+        raise HTTPException(status_code=409, detail="Clone already in progress")
+    
+    async def release_when_finished(progress: int, message: str) -> None:
+        if progress in (100, -1):
+            await jobs.release_lock(lock_name)
         
     # Start cloning process
     tts_service = get_tts_service()
     try:
+        # Reset the flag and start the job in one transaction. The job only
+        # runs once this handler yields, after the commit, so a status check
+        # cannot mark the profile cloned before it is reset
+        voice_profile.is_cloned = False  # Will be set to True when complete
         job_id = await tts_service.clone_voice(
             voice_profile_id=voice_profile_id,
-            audio_path=audio_path
+            audio_path=audio_path,
+            progress_callback=release_when_finished,
         )
-        
-        # Update voice profile status
-        voice_profile.is_cloned = False  # Will be set to True when complete
         db.commit()
+        get_voice_profile_cache().invalidate(voice_profile_id)
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "job_id": job_id,
                 "message": "Voice cloning started"
             }
         )
     except Exception as e:
+        db.rollback()
+        await jobs.release_lock(lock_name)
         logger.error(f"Failed to start voice cloning: {e}")
         raise HTTPException(
             status_code=500,
@@ -83,10 +118,10 @@ async def clone_voice(
 
 
 @router.get("/clone/status/{job_id}")
-async def get_clone_status(
+def get_clone_status(
     job_id: str,
     db: Session = Depends(get_db)
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Get status of voice cloning job."""
     tts_service = get_tts_service()
     status = tts_service.get_job_status(job_id)
@@ -102,75 +137,23 @@ async def get_clone_status(
         if voice_profile and not voice_profile.is_cloned:
             voice_profile.is_cloned = True
             db.commit()
+            get_voice_profile_cache().invalidate(voice_profile.id)
             logger.info(f"Marked voice profile {voice_profile.id} as cloned")
         
-    return JSONResponse(content=status)
-
-
-async def _process_tts_generation(
-    job_id: str,
-    tts_request: TTSRequest,
-    voice_profile: VoiceProfile,
-    tts_service,
-    db: Session
-) -> None:
-    """Process TTS generation in background."""
-    try:
-        # Update progress
-        tts_jobs[job_id]["progress"] = 20
-        
-        # Get audio prompt path
-        audio_prompt_path = None
-        if voice_profile.audio_file_path:
-            audio_prompt_path = voice_profile.audio_file_path
-            
-        # Generate speech
-        params = tts_request.parameters or {}
-        audio_array, sample_rate = await tts_service.generate_speech(
-            text=tts_request.text,
-            voice_profile_id=voice_profile.id,
-            audio_prompt_path=audio_prompt_path,
-            speed=params.get("speed", 1.0),
-            pitch=params.get("pitch", 1.0),
-            emotion=params.get("emotion", "neutral"),
-            exaggeration=params.get("exaggeration", 0.5),
-            cfg_weight=params.get("cfg_weight", 0.5)
-        )
-        
-        # Update progress
-        tts_jobs[job_id]["progress"] = 80
-        
-        # Save output
-        output_path = await tts_service.save_output(
-            audio_array=audio_array,
-            sample_rate=sample_rate,
-            script_id=tts_request.script_id if hasattr(tts_request, 'script_id') else 0,
-            voice_profile_id=voice_profile.id,
-            format="wav"
-        )
-        
-        # Update job status
-        tts_jobs[job_id]["status"] = "completed"
-        tts_jobs[job_id]["progress"] = 100
-        tts_jobs[job_id]["result_url"] = f"/outputs/{output_path.name}"
-        tts_jobs[job_id]["output_path"] = str(output_path)
-        
-        logger.info(f"TTS generation completed for job {job_id}")
-        
-    except Exception as e:
-        logger.error(f"TTS generation failed for job {job_id}: {e}")
-        tts_jobs[job_id]["status"] = "failed"
-        tts_jobs[job_id]["error"] = str(e)
+    return ORJSONResponse(content=status)
 
 
 @router.post("/generate", response_model=TTSJobResponse)
 async def generate_speech(
     tts_request: TTSRequest,
     db: Session = Depends(get_db),
+    jobs: JobStore = Depends(get_job_store),
 ) -> TTSJobResponse:
     """Generate speech from text using a voice profile."""
-    # Validate voice profile exists
-    voice_profile = crud.voice_profile.get(db, id=tts_request.voice_id)
+    # Validate voice profile exists, off the event loop since a miss queries
+    voice_profile = await run_in_threadpool(
+        get_voice_profile_cache().get, db, tts_request.voice_id
+    )
     if not voice_profile:
         raise HTTPException(status_code=404, detail="Voice profile not found")
     
@@ -178,49 +161,34 @@ async def generate_speech(
     job_id = str(uuid.uuid4())
     
     # Create job tracking
-    tts_jobs[job_id] = {
-        "status": "processing",
-        "created_at": datetime.utcnow(),
+    await jobs.create(job_id, {
+        "status": "pending",
+        "created_at": datetime.utcnow().isoformat(),
         "text": tts_request.text,
         "voice_id": tts_request.voice_id,
         "parameters": tts_request.parameters,
         "progress": 0,
-    }
-    
-    # Get TTS service and generate speech
-    tts_service = get_tts_service()
+    })
     
-    # Start async generation
-    import asyncio
-    asyncio.create_task(
-        _process_tts_generation(
-            job_id, 
-            tts_request, 
-            voice_profile, 
-            tts_service,
-            db
-        )
-    )
+    # Hand the job to a TTS worker so inference never runs on the API loop
+    await jobs.enqueue({
+        "job_id": job_id,
+        "text": tts_request.text,
+        "voice_id": tts_request.voice_id,
+        "parameters": tts_request.parameters,
+    })
     
-    logger.info(f"Started TTS job: {job_id} for voice: {voice_profile.name}")
+    logger.info(f"Queued TTS job: {job_id} for voice: {voice_profile.name}")
     
     return TTSJobResponse(
         success=True,
         job_id=job_id,
-        status="processing",
+        status="pending",
     )
 
 
-@router.get("/status/{job_id}", response_model=TTSStatusResponse)
-async def get_tts_status(
-    job_id: str,
-) -> TTSStatusResponse:
-    """Check the status of a TTS generation job."""
-    if job_id not in tts_jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = tts_jobs[job_id]
-    
+def _job_status_response(job_id: str, job: Dict) -> TTSStatusResponse:
+    """Build the status response for a tracked job."""
     return TTSStatusResponse(
         success=True,
         job_id=job_id,
@@ -231,27 +199,90 @@ async def get_tts_status(
     )
 
 
+@router.get("/status/{job_id}", response_model=TTSStatusResponse)
+async def get_tts_status(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=30, description="Seconds to wait for the job to change"),
+    jobs: JobStore = Depends(get_job_store),
+) -> TTSStatusResponse:
+    """Check the status of a TTS generation job.
+    
+    With ``wait`` set, an unfinished job is long-polled until its status or
+    progress changes or the wait runs out, so clients make one request per
+    state change instead of polling repeatedly.
+    """
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if wait and job["status"] not in TERMINAL_STATUSES:
+        await jobs.wait_for_update(job_id, job, wait)
+        job = await jobs.get(job_id) or job
+    
+    return _job_status_response(job_id, job)
+
+
+@router.post("/status/batch", response_model=TTSBatchStatusResponse)
+async def get_tts_status_batch(
+    request: TTSBatchStatusRequest,
+    jobs: JobStore = Depends(get_job_store),
+) -> TTSBatchStatusResponse:
+    """Check the status of several TTS generation jobs in one request."""
+    found = await jobs.get_many(request.job_ids)
+    statuses = {
+        job_id: _job_status_response(job_id, job)
+        for job_id, job in found.items()
+    }
+    
+    return TTSBatchStatusResponse(success=True, statuses=statuses)
+
+
 @router.get("/download/{job_id}")
 async def download_generated_audio(
     job_id: str,
-) -> FileResponse:
-    """Download the generated audio file."""
-    if job_id not in tts_jobs:
+    request: Request,
+    jobs: JobStore = Depends(get_job_store),
+) -> Response:
+    """Download the generated audio file.
+    
+    Outputs never change once written, so repeat downloads are answered with
+    304 when the client already has the file.
+    """
+    job = await jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = tts_jobs[job_id]
     if job["status"] != "completed":
         raise HTTPException(status_code=400, detail="Job not completed")
     
     # Get output path
     output_path = job.get("output_path")
-    if not output_path or not Path(output_path).exists():
+    if not output_path:
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    
+    # One stat both checks the file exists and feeds the ETag and size
+    path = Path(output_path)
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Audio file not found")
+    etag = f'"{hashlib.md5(f"{path}:{stat_result.st_mtime}".encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
     
-    return FileResponse(
-        path=output_path,
+    # Short clips are cheaper to send in one piece than to stream
+    if stat_result.st_size < INLINE_AUDIO_MAX_SIZE:
+        headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        headers["Content-Disposition"] = f'attachment; filename="{path.name}"'
+        return Response(content=path.read_bytes(), media_type="audio/wav", headers=headers)
+    
+    return AudioFileResponse(
+        path=path,
         media_type="audio/wav",
-        filename=Path(output_path).name
+        filename=path.name,
+        headers=headers,
+        stat_result=stat_result,
     )
 
 
@@ -268,12 +299,18 @@ class QuickTTSRequest(BaseModel):
 async def generate_quick_speech(
     request: QuickTTSRequest,
     db: Session = Depends(get_db)
-) -> Dict:
-    """Generate speech quickly for preview."""
+) -> Response:
+    """Generate speech quickly for preview.
+    
+    Returns the audio as WAV bytes, with the sample rate and duration in the
+    X-Sample-Rate and X-Audio-Duration headers.
+    """
     # Get voice profile if specified
     audio_prompt_path = None
     if request.voice_profile_id:
-        voice_profile = db.query(VoiceProfile).filter_by(id=request.voice_profile_id).first()
+        voice_profile = await run_in_threadpool(
+            get_voice_profile_cache().get, db, request.voice_profile_id
+        )
         if not voice_profile:
             raise HTTPException(status_code=404, detail="Voice profile not found")
         if voice_profile.audio_file_path:
@@ -293,12 +330,17 @@ async def generate_quick_speech(
             cfg_weight=0.5
         )
         
-        # Return audio data as JSON
-        return {
-            "audio_data": audio_array.tolist(),
-            "sample_rate": sample_rate,
-            "duration": len(audio_array) / sample_rate
-        }
+        # Return 16-bit WAV bytes, far smaller and cheaper than a JSON float list
+        buffer = io.BytesIO()
+        sf.write(buffer, audio_array, sample_rate, format="WAV", subtype="PCM_16")
+        return Response(
+            content=buffer.getvalue(),
+            media_type="audio/wav",
+            headers={
+                "X-Sample-Rate": str(sample_rate),
+                "X-Audio-Duration": f"{len(audio_array) / sample_rate:.3f}",
+            },
+        )
         
     except Exception as e:
         logger.error(f"Failed to generate quick speech: {e}")
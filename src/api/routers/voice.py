@@ -2,12 +2,16 @@
 
 import logging
 import shutil
+import uuid
 from pathlib import Path
 from typing import List
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from src.api.etag import etag_matches, make_etag
 from src.api.models import (
     ErrorResponse,
     FileUploadResponse,
@@ -15,8 +19,10 @@ from src.api.models import (
     VoiceProfileListResponse,
     VoiceProfileResponse,
     VoiceProfileUpdate,
+    voice_profile_list_adapter,
 )
 from src.models import crud, get_db
+from src.services.voice_profile_cache import get_voice_profile_cache
 from src.utils.audio import validate_audio_file
 from src.utils.config import get_settings
 
@@ -25,6 +31,20 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Resolved once at import: the directory properties mkdir on every access
+TEMP_DIR = settings.temp_dir
+VOICES_SAMPLES_DIR = settings.voices_samples_dir
+MAX_RECORDING_DURATION = settings.max_recording_duration
+
+# Larger than shutil's 64 KB default so multi-MB samples take fewer syscalls
+UPLOAD_COPY_BUFSIZE = 512 * 1024
+
+
+def _save_upload(file: UploadFile, dest: Path) -> None:
+    """Copy an uploaded file to disk without loading it into memory."""
+    with open(dest, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer, UPLOAD_COPY_BUFSIZE)
+
 
 @router.post("/upload", response_model=FileUploadResponse)
 async def upload_audio_file(
@@ -44,18 +64,17 @@ async def upload_audio_file(
         )
     
     # Create temporary file
-    temp_dir = settings.temp_dir
-    temp_path = temp_dir / file.filename
+    temp_path = TEMP_DIR / file.filename
     
     try:
-        # Save uploaded file
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save uploaded file in 512 KB chunks, off the event loop
+        await run_in_threadpool(_save_upload, file, temp_path)
         
-        # Validate audio file
-        is_valid, error_msg = validate_audio_file(
+        # Validate audio file, decoding it off the event loop
+        is_valid, error_msg = await run_in_threadpool(
+            validate_audio_file,
             temp_path,
-            max_duration=settings.max_recording_duration
+            max_duration=MAX_RECORDING_DURATION
         )
         
         if not is_valid:
@@ -63,15 +82,15 @@ async def upload_audio_file(
             raise HTTPException(status_code=400, detail=error_msg)
         
         # Move to voices samples directory
-        final_path = settings.voices_samples_dir / file.filename
+        final_path = VOICES_SAMPLES_DIR / file.filename
         if final_path.exists():
-            # Add timestamp to avoid overwriting
-            stem = final_path.stem
-            suffix = final_path.suffix
-            timestamp = Path(str(temp_path.stat().st_mtime).replace(".", "_"))
-            final_path = final_path.parent / f"{stem}_{timestamp}{suffix}"
+            # Add a short unique suffix to avoid overwriting
+            final_path = final_path.with_name(
+                f"{final_path.stem}_{uuid.uuid4().hex[:8]}{final_path.suffix}"
+            )
         
-        shutil.move(str(temp_path), str(final_path))
+        # A move across filesystems copies the whole file
+        await run_in_threadpool(shutil.move, str(temp_path), str(final_path))
         
         return FileUploadResponse(
             success=True,
@@ -89,7 +108,7 @@ async def upload_audio_file(
 
 
 @router.post("/", response_model=VoiceProfileResponse)
-async def create_voice_profile(
+def create_voice_profile(
     voice_data: VoiceProfileCreate,
     db: Session = Depends(get_db),
 ) -> VoiceProfileResponse:
@@ -120,43 +139,59 @@ async def create_voice_profile(
             "parameters": voice_data.parameters,
         }
     )
+    get_voice_profile_cache().invalidate_count()
     
     logger.info(f"Created voice profile: {voice_profile.name} (ID: {voice_profile.id})")
     return voice_profile
 
 
 @router.get("/", response_model=VoiceProfileListResponse)
-async def list_voice_profiles(
+def list_voice_profiles(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
 ) -> VoiceProfileListResponse:
     """List all voice profiles."""
+    # The total comes from the profile cache, not a COUNT per request
     profiles = crud.voice_profile.get_multi(db, skip=skip, limit=limit)
-    total = db.query(crud.voice_profile.model).count()
+    total = get_voice_profile_cache().count(db)
     
-    return VoiceProfileListResponse(
-        success=True,
-        data=profiles,
-        total=total,
+    # Serialize rows directly with the cached adapter; returning a response
+    # skips FastAPI validating the whole list a second time
+    rows = voice_profile_list_adapter.validate_python(profiles, from_attributes=True)
+    return ORJSONResponse(
+        content={
+            "success": True,
+            "message": None,
+            "data": voice_profile_list_adapter.dump_python(rows, mode="json"),
+            "total": total,
+        }
     )
 
 
 @router.get("/{voice_id}", response_model=VoiceProfileResponse)
-async def get_voice_profile(
+def get_voice_profile(
     voice_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ) -> VoiceProfileResponse:
     """Get a specific voice profile."""
-    voice_profile = crud.voice_profile.get(db, id=voice_id)
+    voice_profile = get_voice_profile_cache().get(db, voice_id)
     if not voice_profile:
         raise HTTPException(status_code=404, detail="Voice profile not found")
     
+    # Let clients revalidate a cached copy without resending the body
+    etag = make_etag(voice_profile)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     return voice_profile
 
 
 @router.put("/{voice_id}", response_model=VoiceProfileResponse)
-async def update_voice_profile(
+def update_voice_profile(
     voice_id: int,
     voice_update: VoiceProfileUpdate,
     db: Session = Depends(get_db),
@@ -178,13 +213,14 @@ async def update_voice_profile(
     # Update voice profile
     update_data = voice_update.model_dump(exclude_unset=True)
     voice_profile = crud.voice_profile.update(db, db_obj=voice_profile, obj_in=update_data)
+    get_voice_profile_cache().invalidate(voice_id)
     
     logger.info(f"Updated voice profile: {voice_profile.name} (ID: {voice_profile.id})")
     return voice_profile
 
 
 @router.put("/{voice_id}/parameters", response_model=VoiceProfileResponse)
-async def update_voice_parameters(
+def update_voice_parameters(
     voice_id: int,
     parameters: dict,
     db: Session = Depends(get_db),
@@ -195,13 +231,14 @@ async def update_voice_parameters(
     )
     if not voice_profile:
         raise HTTPException(status_code=404, detail="Voice profile not found")
+    get_voice_profile_cache().invalidate(voice_id)
     
     logger.info(f"Updated parameters for voice profile: {voice_profile.name} (ID: {voice_profile.id})")
     return voice_profile
 
 
 @router.delete("/{voice_id}")
-async def delete_voice_profile(
+def delete_voice_profile(
     voice_id: int,
     db: Session = Depends(get_db),
 ) -> dict:
@@ -212,16 +249,14 @@ async def delete_voice_profile(
     
     # Delete associated files
     if voice_profile.audio_file_path:
-        audio_path = Path(voice_profile.audio_file_path)
-        if audio_path.exists():
-            try:
-                audio_path.unlink()
-            except Exception as e:
-                logger.error(f"Failed to delete audio file: {e}")
+        try:
+            Path(voice_profile.audio_file_path).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to delete audio file: {e}")
     
     if voice_profile.model_path:
         model_path = Path(voice_profile.model_path)
-        if model_path.exists() and model_path.is_dir():
+        if model_path.is_dir():
             try:
                 shutil.rmtree(model_path)
             except Exception as e:
@@ -229,6 +264,9 @@ async def delete_voice_profile(
     
     # Delete from database
     crud.voice_profile.delete(db, id=voice_id)
+    cache = get_voice_profile_cache()
+    cache.invalidate(voice_id)
+    cache.invalidate_count()
     
     logger.info(f"Deleted voice profile: {voice_profile.name} (ID: {voice_id})")
     return {"success": True, "message": f"Voice profile '{voice_profile.name}' deleted"}
\ No newline at end of file
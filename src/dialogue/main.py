@@ -5,17 +5,18 @@ import logging
 import os
 import platform
 import signal
+import socket
 import sys
 from pathlib import Path
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parents[2]))
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QSocketNotifier, Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication, QSplashScreen
 
-from src.dialogue.main_window import DialogueMainWindow
 from src.gui.themes import get_theme_manager
-from src.models import init_db
 from src.utils.config import get_settings
 
 
@@ -34,6 +35,33 @@ def setup_signal_handlers():
         signal.signal(signal.SIGPIPE, signal.SIG_IGN)
 
 
+def setup_signal_wakeup(app: QApplication) -> None:
+    """Deliver signals to their handlers while Qt's event loop is running.
+    
+    Python only runs signal handlers once control returns to the
+    interpreter, which does not happen while ``app.exec()`` waits for
+    events. The C-level handler writes each signal to a socket pair, and a
+    notifier on the other end wakes the event loop so the handler runs
+    straight away.
+    """
+    read_sock, write_sock = socket.socketpair()
+    read_sock.setblocking(False)
+    write_sock.setblocking(False)
+    signal.set_wakeup_fd(write_sock.fileno())
+    
+    def drain_wakeup_socket():
+        # Returning to Python here is what runs the pending signal handler
+        try:
+            read_sock.recv(64)
+        except BlockingIOError:
+            pass
+    
+    notifier = QSocketNotifier(read_sock.fileno(), QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(drain_wakeup_socket)
+    # Keep both ends open for as long as the notifier lives
+    notifier.destroyed.connect(lambda: (read_sock.close(), write_sock.close()))
+
+
 def setup_logging() -> None:
     """Set up logging configuration."""
     settings = get_settings()
@@ -73,7 +101,8 @@ def main() -> None:
     # Set up logging
     setup_logging()
     
-    # Initialize database (shared with ChatterBloke)
+    # The database is shared with ChatterBloke, which initialises it. The
+    # dialogue app only talks to the API, so SQLAlchemy is never loaded here
     logger = logging.getLogger(__name__)
     logger.info("Using shared ChatterBloke database")
     
@@ -82,14 +111,31 @@ def main() -> None:
     app.setApplicationName("ChatterBloke Dialogue")
     app.setOrganizationName("ChatterBloke Team")
     app.setQuitOnLastWindowClosed(True)
+    setup_signal_wakeup(app)
     
     # Apply theme
     theme_manager = get_theme_manager()
     theme_manager.apply_theme(get_settings().theme, app)
     
+    # Show a splash while the main window's modules (audio, API client) are
+    # imported
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(app.palette().window().color())
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Loading ChatterBloke Dialogue...",
+        Qt.AlignmentFlag.AlignCenter,
+        app.palette().windowText().color(),
+    )
+    splash.show()
+    app.processEvents()
+    
+    from src.dialogue.main_window import DialogueMainWindow
+    
     # Create and show main window
     window = DialogueMainWindow()
     window.show()
+    splash.finish(window)
     
     logger.info("ChatterBloke Dialogue launched successfully")
     
@@ -99,10 +145,9 @@ def main() -> None:
     # Clean up after Qt event loop exits
     logger.info("Application event loop ended")
     
-    # Force cleanup of Qt objects
-    window.deleteLater()
-    app.processEvents()
-    app.deleteLater()
+    # Python owns the top-level window, so dropping the last reference
+    # destroys it now instead of spinning the event loop again
+    window = None
     
     # Exit cleanly
     sys.exit(exit_code)
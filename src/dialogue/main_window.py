@@ -1,12 +1,11 @@
 """Main window for ChatterBloke Dialogue application."""
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import QSettings, Qt, QTimer
+from PyQt6.QtCore import QByteArray, QSettings, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QCloseEvent
 from PyQt6.QtWidgets import (
-    QApplication,
     QMainWindow,
     QMessageBox,
     QSizePolicy,
@@ -17,23 +16,86 @@ from PyQt6.QtWidgets import (
 )
 
 from src.gui.services import get_api_service
-from src.dialogue.tabs.voice_studio import VoiceStudioTab
-from src.dialogue.tabs.dialogue_editor import DialogueEditorTab
-from src.dialogue.tabs.audio_generator import AudioGeneratorTab
-from src.dialogue.tabs.project_manager import ProjectManagerTab
 from src.gui.themes import get_theme_manager
 from src.utils.config import get_settings
 
+# Tab modules are imported when their tab is first built
+if TYPE_CHECKING:
+    from src.dialogue.tabs.audio_generator import AudioGeneratorTab
+    from src.dialogue.tabs.dialogue_editor import DialogueEditorTab
+    from src.dialogue.tabs.project_manager import ProjectManagerTab
+    from src.dialogue.tabs.voice_studio import VoiceStudioTab
+
 
 class DialogueMainWindow(QMainWindow):
     """Main window for dialogue generation application."""
     
+    TAB_NAMES = ("Voice Studio", "Dialogue Editor", "Audio Generator", "Projects")
+    
+    # Menu and toolbar layout, declared once for every window. Entries are
+    # (label, shortcut, tooltip, slot name), None adds a separator
+    EDITOR_MENU = "&Edit"
+    MENUS = (
+        ("&File", (
+            ("&New Dialogue", "Ctrl+N", None, "new_dialogue"),
+            ("&Open Project", "Ctrl+O", None, "open_project"),
+            ("&Save Project", "Ctrl+S", None, "save_project"),
+            None,
+            ("Export &Audio", None, None, "export_audio"),
+            ("Export &Script", None, None, "export_script"),
+            None,
+            ("E&xit", "Ctrl+Q", None, "close"),
+        )),
+        (EDITOR_MENU, (
+            ("&Undo", "Ctrl+Z", None, "undo"),
+            ("&Redo", "Ctrl+Y", None, "redo"),
+        )),
+        ("&Tools", (
+            ("&AI Dialogue Assistant", "Ctrl+G", None, "show_ai_assistant"),
+        )),
+        ("&Help", (
+            ("&About", None, None, "show_about"),
+        )),
+    )
+    TOOLBAR_ACTIONS = (
+        ("📝 New Dialogue", None, "Create a new dialogue project", "new_dialogue"),
+        None,
+        ("🤖 AI Assistant", None, "Generate dialogue with AI", "show_ai_assistant"),
+        None,
+        ("🎵 Generate Audio", None, "Generate audio from current dialogue", "generate_audio"),
+        None,
+        ("▶️ Preview", None, "Preview generated audio", "preview_audio"),
+    )
+    TOOLBAR_END_ACTIONS = (
+        ("❌ Exit", None, "Exit application", "close"),
+    )
+    
+    # API status bar messages
+    MSG_API_CONNECTED = "Connected to API server"
+    MSG_API_UNAVAILABLE = "API server not available"
+    MSG_API_ERROR = "API error: {}".format
+    
+    # Emitted from a worker thread once the API service has stopped
+    api_service_stopped = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         
         self.logger = logging.getLogger(__name__)
         self.settings = get_settings()
         self.api_service = get_api_service()
+        # One settings handle for the window's lifetime
+        self._qsettings = QSettings()
+        # Last geometry and state written to or read from settings
+        self._saved_geometry: Optional[QByteArray] = None
+        self._saved_state: Optional[QByteArray] = None
+        # Timers to stop on close, registered as they are created
+        self._owned_timers: List[QTimer] = []
+        self._shutting_down = False
+        self._shutdown_complete = False
+        # Edit menu actions whose shortcuts belong to the editor tab
+        self._editor_actions: List[QAction] = []
+        self.api_service_stopped.connect(self._on_api_service_stopped)
         
         # Initialize UI
         self.setWindowTitle("ChatterBloke Dialogue - Two-Voice Conversation Generator")
@@ -45,9 +107,10 @@ class DialogueMainWindow(QMainWindow):
         self.create_toolbar()
         self.create_status_bar()
         
-        # Connect signals
-        self.api_service.connected.connect(self.on_api_connected)
-        self.api_service.error.connect(self.on_api_error)
+        # Connect signals, the API service emits from its own thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.api_service.connected.connect(self.on_api_connected, queued)
+        self.api_service.error.connect(self.on_api_error, queued)
         
         # Restore window state
         self.restore_window_state()
@@ -55,92 +118,179 @@ class DialogueMainWindow(QMainWindow):
         # Start API service
         self.api_service.start()
         
+        # Fetch voices for the audio tab while the user is still on the
+        # first tab, the request itself runs on the API service's loop
+        QTimer.singleShot(500, self._prefetch_voices)
+        
     def create_central_widget(self) -> None:
         """Create the central widget with tabs."""
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
         
-        # Create tabs
-        self.voice_studio_tab = VoiceStudioTab(self.api_service)
-        self.dialogue_editor_tab = DialogueEditorTab(self.api_service)
-        self.audio_generator_tab = AudioGeneratorTab(self.api_service)
-        self.project_manager_tab = ProjectManagerTab(self.api_service)
+        # Tabs are built the first time they are shown or used, until then
+        # each one is an empty placeholder
+        self._tab_factories = {
+            0: self._create_voice_studio_tab,
+            1: self._create_dialogue_editor_tab,
+            2: self._create_audio_generator_tab,
+            3: self._create_project_manager_tab,
+        }
+        self._tab_labels = {
+            0: "🎙️ Voice Studio",
+            1: "✍️ Dialogue Editor",
+            2: "🎵 Audio Generator",
+            3: "📁 Projects",
+        }
+        self._built_tabs: Dict[int, QWidget] = {}
         
         # Add tabs
-        self.tabs.addTab(self.voice_studio_tab, "🎙️ Voice Studio")
-        self.tabs.addTab(self.dialogue_editor_tab, "✍️ Dialogue Editor")
-        self.tabs.addTab(self.audio_generator_tab, "🎵 Audio Generator")
-        self.tabs.addTab(self.project_manager_tab, "📁 Projects")
-        
-        # Connect tab change signal
+        for label in self._tab_labels.values():
+            self.tabs.addTab(QWidget(), label)
+        self._ensure_tab(self.tabs.currentIndex())
+        
+        # Connect tab change signal, logging waits for switching to settle
+        self._tab_settled_timer = QTimer(self)
+        self._tab_settled_timer.setSingleShot(True)
+        self._tab_settled_timer.setInterval(150)
+        self._tab_settled_timer.timeout.connect(self.on_tab_settled)
+        self.register_timer(self._tab_settled_timer)
         self.tabs.currentChanged.connect(self.on_tab_changed)
         
+    def _create_voice_studio_tab(self) -> "VoiceStudioTab":
+        """Import and build the voice studio tab."""
+        from src.dialogue.tabs.voice_studio import VoiceStudioTab
+        tab = VoiceStudioTab(self.api_service)
+        tab.voice_manager.voices_changed.connect(self._on_voices_changed)
+        self.register_timer(tab.voice_manager.level_timer)
+        return tab
+        
+    def _create_dialogue_editor_tab(self) -> "DialogueEditorTab":
+        """Import and build the dialogue editor tab."""
+        from src.dialogue.tabs.dialogue_editor import DialogueEditorTab
+        tab = DialogueEditorTab(self.api_service)
+        tab.dialogue_changed.connect(self._on_dialogue_changed)
+        tab.addActions(self._editor_actions)
+        self.register_timer(tab.parse_timer)
+        return tab
+        
+    def _create_audio_generator_tab(self) -> "AudioGeneratorTab":
+        """Import and build the audio generator tab."""
+        from src.dialogue.tabs.audio_generator import AudioGeneratorTab
+        tab = AudioGeneratorTab(self.api_service)
+        tab.dialogue_provider = self._current_dialogue
+        self.register_timer(tab.refresh_timer)
+        self.register_timer(tab.progress_timer)
+        return tab
+        
+    def _create_project_manager_tab(self) -> "ProjectManagerTab":
+        """Import and build the project manager tab."""
+        from src.dialogue.tabs.project_manager import ProjectManagerTab
+        return ProjectManagerTab(self.api_service)
+        
+    def _ensure_tab(self, index: int) -> QWidget:
+        """Get a tab, building it in place of its placeholder on first use."""
+        tab = self._built_tabs.get(index)
+        if tab is not None:
+            return tab
+            
+        # Each factory also wires the tab to the tabs that react to it
+        tab = self._tab_factories[index]()
+        self._built_tabs[index] = tab
+        
+        # Swap the placeholder out without reporting a tab change
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, self._tab_labels[index])
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        return tab
+        
+    def register_timer(self, timer: QTimer) -> None:
+        """Register a timer to be stopped when the window closes."""
+        self._owned_timers.append(timer)
+            
+    def _current_dialogue(self) -> Optional[Dict]:
+        """Get the editor's dialogue, or None if the editor was never opened."""
+        editor = self._built_tabs.get(1)
+        return editor.get_dialogue() if editor is not None else None
+        
+    def _on_voices_changed(self) -> None:
+        """Have the audio generator reload voices when it is next shown."""
+        audio_generator = self._built_tabs.get(2)
+        if audio_generator is not None:
+            audio_generator.mark_voices_stale()
+            
+    def _on_dialogue_changed(self) -> None:
+        """Have the audio generator refetch the dialogue when it is next shown."""
+        audio_generator = self._built_tabs.get(2)
+        if audio_generator is not None:
+            audio_generator.mark_dialogue_stale()
+        
+    @property
+    def voice_studio_tab(self) -> "VoiceStudioTab":
+        """Get the voice studio tab."""
+        return self._ensure_tab(0)
+        
+    @property
+    def dialogue_editor_tab(self) -> "DialogueEditorTab":
+        """Get the dialogue editor tab."""
+        return self._ensure_tab(1)
+        
+    @property
+    def audio_generator_tab(self) -> "AudioGeneratorTab":
+        """Get the audio generator tab."""
+        return self._ensure_tab(2)
+        
+    @property
+    def project_manager_tab(self) -> "ProjectManagerTab":
+        """Get the project manager tab."""
+        return self._ensure_tab(3)
+        
+    def _add_actions(self, target, actions: Tuple[Optional[tuple], ...]) -> List[QAction]:
+        """Add actions to a menu or toolbar.
+        
+        Args:
+            target: Menu or toolbar to add the actions to
+            actions: (label, shortcut, tooltip, slot name) tuples, with None
+                entries adding a separator
+                
+        Returns:
+            The created actions
+        """
+        created = []
+        for entry in actions:
+            if entry is None:
+                target.addSeparator()
+                continue
+            label, shortcut, tooltip, slot_name = entry
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            if tooltip:
+                action.setToolTip(tooltip)
+            action.triggered.connect(getattr(self, slot_name))
+            target.addAction(action)
+            created.append(action)
+        return created
+            
     def create_menu_bar(self) -> None:
         """Create the application menu bar."""
         menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        new_dialogue_action = QAction("&New Dialogue", self)
-        new_dialogue_action.setShortcut("Ctrl+N")
-        new_dialogue_action.triggered.connect(self.new_dialogue)
-        file_menu.addAction(new_dialogue_action)
-        
-        open_project_action = QAction("&Open Project", self)
-        open_project_action.setShortcut("Ctrl+O")
-        open_project_action.triggered.connect(self.open_project)
-        file_menu.addAction(open_project_action)
-        
-        save_project_action = QAction("&Save Project", self)
-        save_project_action.setShortcut("Ctrl+S")
-        save_project_action.triggered.connect(self.save_project)
-        file_menu.addAction(save_project_action)
-        
-        file_menu.addSeparator()
-        
-        export_audio_action = QAction("Export &Audio", self)
-        export_audio_action.triggered.connect(self.export_audio)
-        file_menu.addAction(export_audio_action)
-        
-        export_script_action = QAction("Export &Script", self)
-        export_script_action.triggered.connect(self.export_script)
-        file_menu.addAction(export_script_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
-        
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut("Ctrl+Z")
-        undo_action.triggered.connect(self.dialogue_editor_tab.undo)
-        edit_menu.addAction(undo_action)
-        
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut("Ctrl+Y")
-        redo_action.triggered.connect(self.dialogue_editor_tab.redo)
-        edit_menu.addAction(redo_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-        
-        ai_assist_action = QAction("&AI Dialogue Assistant", self)
-        ai_assist_action.setShortcut("Ctrl+G")
-        ai_assist_action.triggered.connect(self.show_ai_assistant)
-        tools_menu.addAction(ai_assist_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-        
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        for title, actions in self.MENUS:
+            created = self._add_actions(menubar.addMenu(title), actions)
+            if title == self.EDITOR_MENU:
+                self._editor_actions = created
+                
+        # The shortcuts only apply while focus is inside the editor tab, which
+        # adds these actions when it is built
+        for action in self._editor_actions:
+            action.setShortcutContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        # The first tab is built before the menu
+        if 1 in self._built_tabs:
+            self._built_tabs[1].addActions(self._editor_actions)
         
     def create_toolbar(self) -> None:
         """Create the main toolbar."""
@@ -148,46 +298,14 @@ class DialogueMainWindow(QMainWindow):
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
         
-        # New Dialogue
-        new_action = QAction("📝 New Dialogue", self)
-        new_action.setToolTip("Create a new dialogue project")
-        new_action.triggered.connect(self.new_dialogue)
-        toolbar.addAction(new_action)
-        
-        toolbar.addSeparator()
-        
-        # AI Assistant
-        ai_action = QAction("🤖 AI Assistant", self)
-        ai_action.setToolTip("Generate dialogue with AI")
-        ai_action.triggered.connect(self.show_ai_assistant)
-        toolbar.addAction(ai_action)
-        
-        toolbar.addSeparator()
-        
-        # Generate Audio
-        generate_action = QAction("🎵 Generate Audio", self)
-        generate_action.setToolTip("Generate audio from current dialogue")
-        generate_action.triggered.connect(self.generate_audio)
-        toolbar.addAction(generate_action)
-        
-        toolbar.addSeparator()
+        self._add_actions(toolbar, self.TOOLBAR_ACTIONS)
         
-        # Preview
-        preview_action = QAction("▶️ Preview", self)
-        preview_action.setToolTip("Preview generated audio")
-        preview_action.triggered.connect(self.preview_audio)
-        toolbar.addAction(preview_action)
-        
-        # Add spacer
+        # Push the trailing actions to the far end
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         toolbar.addWidget(spacer)
         
-        # Exit
-        exit_action = QAction("❌ Exit", self)
-        exit_action.setToolTip("Exit application")
-        exit_action.triggered.connect(self.close)
-        toolbar.addAction(exit_action)
+        self._add_actions(toolbar, self.TOOLBAR_END_ACTIONS)
         
     def create_status_bar(self) -> None:
         """Create the status bar."""
@@ -195,22 +313,36 @@ class DialogueMainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
         
+        # API status bursts during reconnects repaint at most every 100ms,
+        # showing the latest message once the burst is throttled
+        self._pending_api_status: Optional[tuple] = None
+        self._api_status_timer = QTimer(self)
+        self._api_status_timer.setSingleShot(True)
+        self._api_status_timer.setInterval(100)
+        self._api_status_timer.timeout.connect(self._flush_api_status)
+        self.register_timer(self._api_status_timer)
+        
     def on_tab_changed(self, index: int) -> None:
         """Handle tab change."""
-        tab_names = ["Voice Studio", "Dialogue Editor", "Audio Generator", "Projects"]
-        if 0 <= index < len(tab_names):
-            self.status_bar.showMessage(f"Switched to {tab_names[index]}")
-            self.logger.info(f"Tab changed to: {tab_names[index]}")
+        if 0 <= index < len(self.TAB_NAMES):
+            # The audio generator refreshes itself on show if anything changed
+            self._ensure_tab(index)
+            self.status_bar.showMessage(f"Switched to {self.TAB_NAMES[index]}")
+            self._tab_settled_timer.start()
             
-            # If switching to Audio Generator, refresh voice profiles and set dialogue
-            if index == 2:  # Audio Generator tab
-                # Load voices first
-                self.audio_generator_tab.load_voice_profiles()
-                
-                # Then set the current dialogue from the editor
-                dialogue = self.dialogue_editor_tab.get_dialogue()
-                if dialogue:
-                    self.audio_generator_tab.set_dialogue(dialogue)
+    def _prefetch_voices(self) -> None:
+        """Build the audio generator tab off-screen and load its voices."""
+        if self._shutting_down:
+            return
+        self.audio_generator_tab.prefetch_voices()
+        
+    def on_tab_settled(self) -> None:
+        """Log the tab the user stopped on after switching through tabs."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        index = self.tabs.currentIndex()
+        if 0 <= index < len(self.TAB_NAMES):
+            self.logger.info(f"Tab changed to: {self.TAB_NAMES[index]}")
             
     def new_dialogue(self) -> None:
         """Create a new dialogue project."""
@@ -239,6 +371,14 @@ class DialogueMainWindow(QMainWindow):
         self.tabs.setCurrentWidget(self.dialogue_editor_tab)
         self.dialogue_editor_tab.show_ai_assistant()
         
+    def undo(self) -> None:
+        """Undo the last edit in the dialogue editor."""
+        self.dialogue_editor_tab.undo()
+        
+    def redo(self) -> None:
+        """Redo the last undone edit in the dialogue editor."""
+        self.dialogue_editor_tab.redo()
+        
     def generate_audio(self) -> None:
         """Generate audio from current dialogue."""
         # Get current dialogue
@@ -266,25 +406,56 @@ class DialogueMainWindow(QMainWindow):
         )
         
     def save_window_state(self) -> None:
-        """Save window geometry and state."""
-        settings = QSettings()
-        settings.setValue("dialogue/geometry", self.saveGeometry())
-        settings.setValue("dialogue/windowState", self.saveState())
+        """Save window geometry and state.
+        
+        Values that match what is already stored are not rewritten, so an
+        unchanged window does not mark the settings file for a sync.
+        """
+        geometry = self.saveGeometry()
+        state = self.saveState()
+        settings = self._qsettings
+        settings.beginGroup("dialogue")
+        if geometry != self._saved_geometry:
+            settings.setValue("geometry", geometry)
+            self._saved_geometry = geometry
+        if state != self._saved_state:
+            settings.setValue("windowState", state)
+            self._saved_state = state
+        settings.endGroup()
         
     def restore_window_state(self) -> None:
         """Restore window geometry and state."""
-        settings = QSettings()
-        geometry = settings.value("dialogue/geometry")
+        settings = self._qsettings
+        settings.beginGroup("dialogue")
+        geometry = settings.value("geometry")
+        state = settings.value("windowState")
+        settings.endGroup()
+        
+        self._saved_geometry = geometry
+        self._saved_state = state
         if geometry:
             self.restoreGeometry(geometry)
-        state = settings.value("dialogue/windowState")
         if state:
             self.restoreState(state)
             
     def closeEvent(self, event: QCloseEvent) -> None:
-        """Handle window close event."""
-        # Check for unsaved changes
-        if self.dialogue_editor_tab.has_unsaved_changes():
+        """Handle window close event.
+        
+        The first accepted close cleans up and stops the API service on a
+        worker thread, keeping the window responsive, then closes the
+        window again once the service has stopped.
+        """
+        if self._shutdown_complete:
+            self.logger.info("ChatterBloke Dialogue closing")
+            event.accept()
+            return
+        if self._shutting_down:
+            event.ignore()
+            return
+            
+        # Check for unsaved changes, an editor that was never opened has none
+        editor = self._built_tabs.get(1)
+        if editor is not None and editor.has_unsaved_changes():
             reply = QMessageBox.question(
                 self,
                 "Unsaved Changes",
@@ -297,7 +468,7 @@ class DialogueMainWindow(QMainWindow):
             
             if reply == QMessageBox.StandardButton.Save:
                 self.save_project()
-                if self.dialogue_editor_tab.has_unsaved_changes():
+                if editor.has_unsaved_changes():
                     event.ignore()
                     return
             elif reply == QMessageBox.StandardButton.Cancel:
@@ -307,34 +478,62 @@ class DialogueMainWindow(QMainWindow):
         # Save window state
         self.save_window_state()
         
-        # Clean up tabs
+        # Clean up tabs, every tab class has cleanup() and placeholders
+        # for unbuilt tabs have nothing to clean up
         self.logger.info("Cleaning up tabs...")
-        for i in range(self.tabs.count()):
-            tab = self.tabs.widget(i)
-            if hasattr(tab, 'cleanup'):
-                tab.cleanup()
+        for tab in self._built_tabs.values():
+            tab.cleanup()
                 
-        # Stop API service
-        self.logger.info("Stopping API service...")
-        self.api_service.stop()
-        
         # Clean up timers
-        for widget in self.findChildren(QTimer):
-            widget.stop()
+        for timer in self._owned_timers:
+            timer.stop()
             
-        QApplication.processEvents()
-        
-        self.logger.info("ChatterBloke Dialogue closing")
-        event.accept()
+        # Stop API service, waiting for it happens off the GUI thread
+        self.logger.info("Stopping API service...")
+        self._shutting_down = True
+        self.centralWidget().setEnabled(False)
+        self.status_bar.showMessage("Shutting down...")
+        QThreadPool.globalInstance().start(self._stop_api_service)
+        event.ignore()
+        
+    def _stop_api_service(self) -> None:
+        """Stop the API service, run on a worker thread."""
+        try:
+            self.api_service.stop()
+        except Exception as e:
+            # An exception escaping a pool thread would abort the app
+            self.logger.error(f"Failed to stop API service cleanly: {e!r}")
+        finally:
+            self.api_service_stopped.emit()
+            
+    def _on_api_service_stopped(self) -> None:
+        """Finish closing once the API service has stopped."""
+        self._shutdown_complete = True
+        self.close()
         
     def on_api_connected(self, is_connected: bool) -> None:
         """Handle API connection status."""
         if is_connected:
-            self.status_bar.showMessage("Connected to API server", 3000)
+            self._show_api_status(self.MSG_API_CONNECTED, 3000)
         else:
-            self.status_bar.showMessage("API server not available")
+            self._show_api_status(self.MSG_API_UNAVAILABLE)
             
     def on_api_error(self, error_msg: str) -> None:
         """Handle API errors."""
         self.logger.error(f"API error: {error_msg}")
-        self.status_bar.showMessage(f"API error: {error_msg}", 5000)
\ No newline at end of file
+        self._show_api_status(self.MSG_API_ERROR(error_msg), 5000)
+        
+    def _show_api_status(self, message: str, timeout: int = 0) -> None:
+        """Show an API status message, throttled to one repaint per 100ms."""
+        if self._api_status_timer.isActive():
+            self._pending_api_status = (message, timeout)
+            return
+        self.status_bar.showMessage(message, timeout)
+        self._api_status_timer.start()
+        
+    def _flush_api_status(self) -> None:
+        """Show the latest API status that arrived while throttled."""
+        if self._pending_api_status is not None:
+            message, timeout = self._pending_api_status
+            self._pending_api_status = None
+            self._show_api_status(message, timeout)
\ No newline at end of file
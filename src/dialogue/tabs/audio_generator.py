@@ -1,14 +1,21 @@
 """Audio generator tab for creating dialogue audio."""
 
 import asyncio
+import io
 import json
 import logging
 import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal
+import soundfile as sf
+from PyQt6.QtCore import QThreadPool, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QShowEvent
 from PyQt6.QtWidgets import (
     QComboBox,
     QDoubleSpinBox,
@@ -17,23 +24,30 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
     QSlider,
     QSpinBox,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from src.gui.services import APIService
 from src.utils.audio import AudioPlayer
+from src.utils.cache import DiskCache
+from src.utils.config import get_settings
 
 
 class AudioGeneratorTab(QWidget):
     """Tab for generating audio from dialogue scripts."""
     
     generation_complete = pyqtSignal(str)  # Path to generated audio
+    line_generated = pyqtSignal(int)       # Lines generated so far
+    export_finished = pyqtSignal(str, str)  # Export path, error or ""
+    
+    # Seconds after a load during which the refresh button reuses it
+    VOICE_REFRESH_INTERVAL = 5.0
     
     def __init__(self, api_service: APIService):
         super().__init__()
@@ -45,14 +59,42 @@ class AudioGeneratorTab(QWidget):
         self.voice_profiles: List[Dict] = []
         self.audio_player = AudioPlayer()
         self._pending_dialogue = False
+        # Generated lines, kept across sessions for dialogues that repeat them
+        settings = get_settings()
+        self.tts_cache = DiskCache(settings.outputs_dir / "tts_cache", suffix=".wav")
+        self.output_dir = settings.outputs_dir / "dialogues"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Lines requested from the TTS server at the same time
+        self.max_concurrent_lines = settings.tts_concurrent_requests
+        
+        # Refreshes requested while the tab was hidden, run on the next show.
+        # Voices are first loaded when the tab is shown, not when built
+        self.dialogue_provider: Optional[Callable[[], Optional[Dict]]] = None
+        self._voices_stale = True
+        self._dialogue_stale = True
+        self._loading_voices = False
+        self._generate_pending = False
+        self._last_voice_fetch = float("-inf")
+        
+        # Wait for tab switching to settle before refreshing on show
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(150)
+        self.refresh_timer.timeout.connect(self._refresh_if_visible)
         
         # Audio generation state
         self.is_generating = False
         self.generation_progress = 0
         self.total_lines = 0
+        self.line_generated.connect(self._on_line_generated)
+        # Cached lines finish in bursts, progress repaints are coalesced
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.setInterval(33)
+        self.progress_timer.timeout.connect(self._flush_progress)
+        self.export_finished.connect(self._on_export_finished)
         
         self.init_ui()
-        self.load_voice_profiles()
         
     def init_ui(self) -> None:
         """Initialize the user interface."""
@@ -62,7 +104,7 @@ class AudioGeneratorTab(QWidget):
         preview_group = QGroupBox("Dialogue Preview")
         preview_layout = QVBoxLayout(preview_group)
         
-        self.dialogue_preview = QTextEdit()
+        self.dialogue_preview = QPlainTextEdit()
         self.dialogue_preview.setReadOnly(True)
         self.dialogue_preview.setMaximumHeight(150)
         preview_layout.addWidget(self.dialogue_preview)
@@ -86,7 +128,7 @@ class AudioGeneratorTab(QWidget):
         self.refresh_voices_btn = QPushButton("🔄")
         self.refresh_voices_btn.setToolTip("Refresh voice list")
         self.refresh_voices_btn.setMaximumWidth(30)
-        self.refresh_voices_btn.clicked.connect(self.load_voice_profiles)
+        self.refresh_voices_btn.clicked.connect(self.refresh_voice_profiles)
         speaker_a_layout.addWidget(self.refresh_voices_btn)
         
         voice_layout.addLayout(speaker_a_layout)
@@ -130,7 +172,7 @@ class AudioGeneratorTab(QWidget):
         self.pitch_a_label = QLabel("0")
         self.pitch_a_label.setMinimumWidth(30)
         speaker_a_params_layout.addWidget(self.pitch_a_label)
-        self.pitch_a_slider.valueChanged.connect(lambda v: self.pitch_a_label.setText(str(v)))
+        self.pitch_a_slider.valueChanged.connect(self.pitch_a_label.setNum)
         
         speaker_a_params_layout.addWidget(QLabel("Emotion:"))
         self.emotion_a_combo = QComboBox()
@@ -161,7 +203,7 @@ class AudioGeneratorTab(QWidget):
         self.pitch_b_label = QLabel("0")
         self.pitch_b_label.setMinimumWidth(30)
         speaker_b_params_layout.addWidget(self.pitch_b_label)
-        self.pitch_b_slider.valueChanged.connect(lambda v: self.pitch_b_label.setText(str(v)))
+        self.pitch_b_slider.valueChanged.connect(self.pitch_b_label.setNum)
         
         speaker_b_params_layout.addWidget(QLabel("Emotion:"))
         self.emotion_b_combo = QComboBox()
@@ -227,8 +269,66 @@ class AudioGeneratorTab(QWidget):
         # Add stretch to push everything to the top
         layout.addStretch()
         
+    def showEvent(self, event: QShowEvent) -> None:
+        """Run refreshes that were deferred while the tab was hidden.
+        
+        Quickly cycling through tabs shows this one only in passing, so the
+        refresh waits until the tab has stayed visible for a moment.
+        """
+        super().showEvent(event)
+        self.refresh_timer.start()
+        
+    def _refresh_if_visible(self) -> None:
+        """Refresh once tab switching settled, unless the tab was left again."""
+        if self.isVisible():
+            self._refresh_stale()
+        
+    def mark_voices_stale(self) -> None:
+        """Reload voice profiles now if visible, otherwise on the next show."""
+        self._voices_stale = True
+        if self.isVisible():
+            self._refresh_stale()
+            
+    def mark_dialogue_stale(self) -> None:
+        """Refetch the dialogue now if visible, otherwise on the next show."""
+        self._dialogue_stale = True
+        if self.isVisible():
+            self._refresh_stale()
+            
+    def prefetch_voices(self) -> None:
+        """Load voice profiles now so they are ready by the first show."""
+        if self._voices_stale:
+            self._voices_stale = False
+            self.load_voice_profiles()
+            
+    def _refresh_stale(self) -> None:
+        """Reload whatever changed since the tab was last shown."""
+        if self._voices_stale:
+            self._voices_stale = False
+            self.load_voice_profiles()
+            
+        if self._dialogue_stale and self.dialogue_provider is not None:
+            self._dialogue_stale = False
+            dialogue = self.dialogue_provider()
+            if dialogue:
+                self.set_dialogue(dialogue)
+        
+    def refresh_voice_profiles(self) -> None:
+        """Reload voice profiles, unless they were loaded moments ago.
+        
+        Changes made in the app mark the voices stale and reload them
+        anyway, so repeated clicks needn't refetch the list each time.
+        """
+        if (
+            self.voice_profiles
+            and time.monotonic() - self._last_voice_fetch < self.VOICE_REFRESH_INTERVAL
+        ):
+            return
+        self.load_voice_profiles()
+        
     def load_voice_profiles(self) -> None:
         """Load available voice profiles."""
+        self._loading_voices = True
         if not self.api_service.client:
             self.logger.warning("API service not connected, retrying in 500ms...")
             QTimer.singleShot(500, self.load_voice_profiles)
@@ -238,28 +338,35 @@ class AudioGeneratorTab(QWidget):
             try:
                 profiles = await self.api_service.client.list_voice_profiles()
                 self.logger.info(f"Loaded {len(profiles)} voice profiles")
-                # Only show cloned voices
-                cloned = [p for p in profiles if p.get("is_cloned", False)]
+                # Only show cloned voices. Kept as JSON-ready dicts, so they
+                # compare by value and their update time can key the cache
+                cloned = [p.model_dump(mode="json") for p in profiles if p.is_cloned]
                 self.logger.info(f"Found {len(cloned)} cloned voices")
                 return cloned
             except Exception as e:
                 self.logger.error(f"Failed to load voice profiles: {e}")
                 return []
                 
-        future = self.api_service.run_async(load())
-        
-        def check_result():
-            if future.done():
-                try:
-                    self.voice_profiles = future.result()
-                    self.update_voice_combos()
-                except Exception as e:
-                    self.logger.error(f"Error loading voices: {e}")
-                    QMessageBox.warning(self, "Error", "Failed to load voice profiles")
-            else:
-                QTimer.singleShot(50, check_result)
-                
-        QTimer.singleShot(0, check_result)
+        self.api_service.run_async(load(), self._on_voice_profiles_loaded, self)
+        
+    def _on_voice_profiles_loaded(self, future: Future) -> None:
+        """Show the loaded voice profiles."""
+        self._loading_voices = False
+        try:
+            profiles = future.result()
+            self._last_voice_fetch = time.monotonic()
+            # Rebuilding unchanged combos would only lose the selected voices
+            if profiles != self.voice_profiles or not self.voice_a_combo.count():
+                self.voice_profiles = profiles
+                self.update_voice_combos()
+        except Exception as e:
+            self.logger.error(f"Error loading voices: {e}")
+            QMessageBox.warning(self, "Error", "Failed to load voice profiles")
+            
+        # Run a generation that was requested before the voices arrived
+        if self._generate_pending:
+            self._generate_pending = False
+            self.generate()
         
     def update_voice_combos(self) -> None:
         """Update voice selection combos."""
@@ -287,6 +394,8 @@ class AudioGeneratorTab(QWidget):
     def set_dialogue(self, dialogue: Dict) -> None:
         """Set dialogue to generate audio from."""
         self.current_dialogue = dialogue
+        # A dialogue pushed in directly is current, the next show needn't refetch it
+        self._dialogue_stale = False
         
         if not dialogue:
             self.dialogue_preview.clear()
@@ -305,13 +414,13 @@ class AudioGeneratorTab(QWidget):
         lines = dialogue.get("lines", [])
         self.logger.info(f"Dialogue has {len(lines)} lines")
         
-        preview_text = []
-        for i, line in enumerate(lines[:5]):  # Show first 5 lines
-            preview_text.append(f"{line['speaker']}: {line['text']}")
+        preview_text = "\n".join(
+            f"{line['speaker']}: {line['text']}" for line in lines[:5]  # Show first 5 lines
+        )
         if len(lines) > 5:
-            preview_text.append(f"... and {len(lines) - 5} more lines")
+            preview_text += f"\n... and {len(lines) - 5} more lines"
             
-        self.dialogue_preview.setPlainText('\n'.join(preview_text))
+        self.dialogue_preview.setPlainText(preview_text)
         
         # Check if we need to wait for voices to load
         if not self.voice_profiles:
@@ -330,6 +439,14 @@ class AudioGeneratorTab(QWidget):
         if not self.current_dialogue or self.is_generating:
             return
             
+        # Voices are still loading, generate once they arrive
+        if self._voices_stale or self._loading_voices:
+            self._generate_pending = True
+            if self._voices_stale:
+                self._voices_stale = False
+                self.load_voice_profiles()
+            return
+            
         # Check voice selection
         if self.voice_a_combo.currentData() is None or self.voice_b_combo.currentData() is None:
             QMessageBox.warning(self, "No Voices", "Please select voices for both speakers.")
@@ -368,102 +485,188 @@ class AudioGeneratorTab(QWidget):
         
         pause_duration = self.pause_spin.value()
         
+        # Lines by anyone other than speaker A use speaker B's voice. Speaker A
+        # comes last so it wins if both speakers share a name
+        params_by_speaker = {
+            self.current_dialogue.get("speaker_b", "Speaker B"): params_b,
+            self.current_dialogue.get("speaker_a", "Speaker A"): params_a,
+        }
+        
         # Generate audio for each line
-        self.generate_dialogue_audio(params_a, params_b, pause_duration)
+        self.generate_dialogue_audio(params_by_speaker, params_b, pause_duration)
+        
+    def generate_dialogue_audio(
+        self, params_by_speaker: Dict[str, Dict], default_params: Dict, pause_duration: float
+    ) -> None:
+        """Generate audio for the dialogue.
+        
+        Args:
+            params_by_speaker: Voice parameters for each speaker name
+            default_params: Voice parameters for lines by any other speaker
+            pause_duration: Seconds of silence after each line
+        """
+        lines = self.current_dialogue.get("lines", [])
+        line_params = [
+            params_by_speaker.get(line["speaker"], default_params) for line in lines
+        ]
+        voice_versions = {
+            profile["id"]: profile.get("updated_at") for profile in self.voice_profiles
+        }
         
-    def generate_dialogue_audio(self, params_a: Dict, params_b: Dict, pause_duration: float) -> None:
-        """Generate audio for the dialogue."""
+        payloads = [
+            {
+                "text": line["text"],
+                "voice_profile_id": params["voice_profile_id"],
+                "speed": params["speed"],
+                "pitch": params["pitch"],
+                "emotion": params["emotion"],
+            }
+            for line, params in zip(lines, line_params)
+        ]
+        # Repeated lines reuse earlier audio, unless the voice has since been
+        # updated
+        cache_keys = [
+            json.dumps(
+                [payload, voice_versions.get(payload["voice_profile_id"])], sort_keys=True
+            )
+            for payload in payloads
+        ]
+        
+        async def request(i: int, semaphore: asyncio.Semaphore) -> bytes:
+            """Generate one line's audio on the server."""
+            async with semaphore:
+                self.logger.info(f"Generating line {i+1}/{len(lines)}: {lines[i]['text'][:50]}...")
+                session = await self.api_service.client.get_session()
+                async with session.post("/api/tts/generate/quick", json=payloads[i]) as response:
+                    response.raise_for_status()
+                    return await response.read()
+                    
+        async def cache_line(i: int, semaphore: asyncio.Semaphore) -> None:
+            """Generate one line's audio into the disk cache."""
+            self.tts_cache.set(cache_keys[i], await request(i, semaphore))
+            
+        # Lines being generated by cache key, shared by lines that repeat
+        in_flight: Dict[str, asyncio.Future] = {}
+        
+        async def synthesize(i: int, semaphore: asyncio.Semaphore) -> None:
+            """Make sure one line's audio is in the disk cache.
+            
+            Lines finished ahead of the writer wait there rather than in
+            memory, so memory use does not grow with the dialogue length.
+            """
+            # Blank lines have nothing to say, so are skipped without a request
+            key = cache_keys[i]
+            if payloads[i]["text"].strip() and key not in self.tts_cache:
+                # Repeats of a line still being generated wait for it rather
+                # than requesting it again
+                if key not in in_flight:
+                    in_flight[key] = asyncio.ensure_future(cache_line(i, semaphore))
+                await in_flight[key]
+                
+            # Queued to the GUI thread, widgets are not touched from here
+            self.generation_progress += 1
+            self.line_generated.emit(self.generation_progress)
+            
         async def generate_async():
+            # Queue every line at once, as many in flight as the server runs
+            # at a time. Lines are queued grouped by voice so the server
+            # switches voices as rarely as possible
+            semaphore = asyncio.Semaphore(self.max_concurrent_lines)
+            order = sorted(range(len(lines)), key=lambda i: line_params[i]["voice_profile_id"])
+            tasks = {i: asyncio.ensure_future(synthesize(i, semaphore)) for i in order}
+            
+            out = None
+            tmp_file = None
             try:
-                lines = self.current_dialogue.get("lines", [])
-                speaker_a = self.current_dialogue.get("speaker_a", "Speaker A")
-                speaker_b = self.current_dialogue.get("speaker_b", "Speaker B")
-                
-                audio_segments = []
-                sample_rate = 24000  # Default sample rate
-                
-                for i, line in enumerate(lines):
-                    # Update progress
-                    self.generation_progress = i
-                    
-                    # Determine which voice to use
-                    if line["speaker"] == speaker_a:
-                        params = params_a
-                    else:
-                        params = params_b
+                # Write each line as soon as it and the lines before it are
+                # done, rather than waiting for the whole dialogue
+                for i in range(len(lines)):
+                    await tasks.pop(i)
+                    if not payloads[i]["text"].strip():
+                        continue
+                    wav_bytes = self.tts_cache.get(cache_keys[i])
+                    if wav_bytes is None:
+                        # Pruned from the cache before its turn came
+                        wav_bytes = await request(i, semaphore)
                         
-                    # Generate audio for this line
-                    self.logger.info(f"Generating line {i+1}/{len(lines)}: {line['text'][:50]}...")
-                    
-                    response = await self.api_service.client._request(
-                        "POST",
-                        "/api/tts/generate/quick",
-                        json={
-                            "text": line["text"],
-                            "voice_profile_id": params["voice_profile_id"],
-                            "speed": params["speed"],
-                            "pitch": params["pitch"],
-                            "emotion": params["emotion"],
-                        }
-                    )
-                    
-                    # Get audio data
-                    audio_data = response.get("audio_data", [])
-                    if audio_data:
-                        audio_array = np.array(audio_data, dtype=np.float32)
-                        audio_segments.append(audio_array)
+                    # Decode the 16-bit WAV response as-is, the output file is
+                    # 16-bit too, so samples pass through without a float
+                    # round trip
+                    audio_array, sample_rate = sf.read(io.BytesIO(wav_bytes), dtype="int16")
+                    del wav_bytes
+                    if not len(audio_array):
+                        continue
                         
-                        # Add pause after each line (except the last)
-                        if i < len(lines) - 1 and pause_duration > 0:
-                            pause_samples = int(sample_rate * pause_duration)
-                            pause_array = np.zeros(pause_samples, dtype=np.float32)
-                            audio_segments.append(pause_array)
-                            
-                    # Update UI
-                    self.progress_bar.setValue(i + 1)
-                    self.status_label.setText(f"Generated {i + 1}/{len(lines)} lines...")
-                    
-                # Combine all segments
-                if audio_segments:
-                    combined_audio = np.concatenate(audio_segments)
-                    
-                    # Save to temporary file
-                    from src.utils.config import get_settings
-                    settings = get_settings()
-                    output_dir = settings.outputs_dir / "dialogues"
-                    output_dir.mkdir(exist_ok=True)
-                    
-                    timestamp = asyncio.get_event_loop().time()
-                    output_file = output_dir / f"dialogue_{int(timestamp)}.wav"
-                    
-                    # Save audio
-                    import soundfile as sf
-                    sf.write(str(output_file), combined_audio, sample_rate)
-                    
-                    return str(output_file)
+                    if out is None:
+                        # Write to a temporary file, renamed into place once
+                        # complete so a partial file is never seen
+                        fd, tmp_file = tempfile.mkstemp(
+                            dir=self.output_dir, prefix=".dialogue_", suffix=".wav.tmp"
+                        )
+                        os.close(fd)
+                        channels = audio_array.shape[1] if audio_array.ndim > 1 else 1
+                        out = sf.SoundFile(
+                            tmp_file, "w", sample_rate, channels, format="WAV", subtype="PCM_16"
+                        )
+                        
+                        # One silent buffer serves every pause
+                        pause_array = np.zeros(int(sample_rate * pause_duration), dtype=np.int16)
+                    elif len(pause_array):
+                        # Pause between lines, written before every line but
+                        # the first so none trails the last spoken line
+                        out.write(pause_array)
+                        
+                    out.write(audio_array)
+                    del audio_array
                     
+                if out is None:
+                    return None
+                out.close()
+                
+                timestamp = asyncio.get_event_loop().time()
+                output_file = self.output_dir / f"dialogue_{int(timestamp)}.wav"
+                os.replace(tmp_file, output_file)
+                return str(output_file)
+                
             except Exception as e:
                 self.logger.error(f"Failed to generate audio: {e}")
+                # Drop the partial file and stop requesting the rest
+                for task in tasks.values():
+                    task.cancel()
+                if out is not None:
+                    out.close()
+                if tmp_file is not None:
+                    Path(tmp_file).unlink(missing_ok=True)
                 raise
                 
-        future = self.api_service.run_async(generate_async())
-        
-        def check_result():
-            if future.done():
-                try:
-                    audio_path = future.result()
-                    self.on_generation_complete(audio_path)
-                except Exception as e:
-                    self.on_generation_error(str(e))
-            else:
-                QTimer.singleShot(100, check_result)
-                
-        QTimer.singleShot(0, check_result)
+        self.api_service.run_async(generate_async(), self._on_generation_done, self)
+        
+    def _on_generation_done(self, future: Future) -> None:
+        """Report the result of a dialogue generation."""
+        try:
+            audio_path = future.result()
+            self.on_generation_complete(audio_path)
+        except Exception as e:
+            self.on_generation_error(str(e))
+            
+    def _on_line_generated(self, done: int) -> None:
+        """Show generation progress, at most about 30 times a second."""
+        if not self.progress_timer.isActive():
+            self.progress_timer.start()
+            
+    def _flush_progress(self) -> None:
+        """Show how many dialogue lines have been generated."""
+        if not self.is_generating:
+            return
+        done = self.generation_progress
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"Generated {done}/{self.total_lines} lines...")
         
     def on_generation_complete(self, audio_path: str) -> None:
         """Handle successful audio generation."""
         self.generated_audio_path = audio_path
         self.is_generating = False
+        self.progress_timer.stop()
         
         # Update UI
         self.progress_bar.setVisible(False)
@@ -482,6 +685,7 @@ class AudioGeneratorTab(QWidget):
     def on_generation_error(self, error_msg: str) -> None:
         """Handle generation error."""
         self.is_generating = False
+        self.progress_timer.stop()
         
         # Update UI
         self.progress_bar.setVisible(False)
@@ -502,10 +706,8 @@ class AudioGeneratorTab(QWidget):
             return
             
         try:
-            with open(self.generated_audio_path, 'rb') as f:
-                audio_data = f.read()
-                
-            if self.audio_player.play(audio_data):
+            # Pass the path so the player streams the file from disk
+            if self.audio_player.play(self.generated_audio_path):
                 self.preview_btn.setEnabled(False)
                 self.stop_btn.setEnabled(True)
                 self.status_label.setText("Playing audio...")
@@ -548,31 +750,51 @@ class AudioGeneratorTab(QWidget):
         )
         
         if filename:
-            try:
-                # Copy the file
-                import shutil
-                shutil.copy2(self.generated_audio_path, filename)
-                
-                self.status_label.setText(f"Exported to {Path(filename).name}")
-                QMessageBox.information(
-                    self,
-                    "Export Complete",
-                    f"Audio exported successfully to:\n{filename}"
-                )
-            except Exception as e:
-                self.logger.error(f"Export error: {e}")
-                QMessageBox.critical(
-                    self,
-                    "Export Error",
-                    f"Failed to export audio:\n{e}"
-                )
-                
+            # Copy on a worker thread, long dialogues make large files
+            self.export_btn.setEnabled(False)
+            self.status_label.setText(f"Exporting to {Path(filename).name}...")
+            source = self.generated_audio_path
+            QThreadPool.globalInstance().start(lambda: self._copy_audio(source, filename))
+            
+    def _copy_audio(self, source: str, filename: str) -> None:
+        """Copy generated audio to its export location, runs on a worker thread."""
+        error = ""
+        try:
+            shutil.copy2(source, filename)
+        except Exception as e:
+            error = str(e)
+        try:
+            self.export_finished.emit(filename, error)
+        except RuntimeError:
+            # The tab was deleted while the copy ran
+            pass
+            
+    def _on_export_finished(self, filename: str, error: str) -> None:
+        """Report the result of an export."""
+        self.export_btn.setEnabled(True)
+        if error:
+            self.logger.error(f"Export error: {error}")
+            self.status_label.setText("Export failed")
+            QMessageBox.critical(
+                self,
+                "Export Error",
+                f"Failed to export audio:\n{error}"
+            )
+            return
+            
+        self.status_label.setText(f"Exported to {Path(filename).name}")
+        QMessageBox.information(
+            self,
+            "Export Complete",
+            f"Audio exported successfully to:\n{filename}"
+        )
+        
     def cleanup(self) -> None:
         """Clean up resources."""
         self.stop_playback()
         # Clean up temporary files
-        if self.generated_audio_path and os.path.exists(self.generated_audio_path):
+        if self.generated_audio_path:
             try:
-                os.remove(self.generated_audio_path)
-            except:
-                pass
\ No newline at end of file
+                Path(self.generated_audio_path).unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning(f"Failed to remove generated audio: {e}")
\ No newline at end of file
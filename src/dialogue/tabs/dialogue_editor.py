@@ -4,16 +4,17 @@ import json
 import logging
 from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QTextCharFormat, QColor
+from PyQt6.QtCore import QSignalBlocker, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QFont, QTextCharFormat, QTextCursor, QColor
 from PyQt6.QtWidgets import (
     QComboBox,
+    QFileDialog,
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSplitter,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -21,9 +22,17 @@ from PyQt6.QtWidgets import (
 from src.gui.services import APIService
 
 
+# Generic speaker names, shown as the custom name of their speaker
+SPEAKER_A_ALIASES = frozenset({"Speaker A", "Pro", "Reviewer", "Comedian A"})
+SPEAKER_B_ALIASES = frozenset({"Speaker B", "Con", "Author", "Comedian B"})
+
+
 class DialogueLine:
     """Represents a single line of dialogue."""
     
+    # Scripts hold one of these per line, slots keep them small
+    __slots__ = ("speaker", "text")
+    
     def __init__(self, speaker: str, text: str):
         self.speaker = speaker
         self.text = text
@@ -34,6 +43,17 @@ class DialogueLine:
     @classmethod
     def from_dict(cls, data: Dict) -> "DialogueLine":
         return cls(data["speaker"], data["text"])
+        
+    @classmethod
+    def parse(cls, line: str) -> Optional["DialogueLine"]:
+        """Parse a "Speaker: text" line, or None if it isn't one."""
+        speaker, sep, dialogue = line.partition(':')
+        if sep:
+            speaker = speaker.strip()
+            dialogue = dialogue.strip()
+            if speaker and dialogue:
+                return cls(speaker, dialogue)
+        return None
 
 
 class DialogueEditorTab(QWidget):
@@ -47,9 +67,19 @@ class DialogueEditorTab(QWidget):
         self.logger = logging.getLogger(__name__)
         
         self.dialogue_lines: List[DialogueLine] = []
+        # Parsed line for each block of the editor, None for other text
+        self._block_lines: List[Optional[DialogueLine]] = [None]
         self.current_project_id: Optional[int] = None
         self.current_script_id: Optional[int] = None
         self._has_unsaved_changes = False
+        # Last get_dialogue() result, dropped whenever the lines may change
+        self._dialogue_cache: Optional[Dict] = None
+        
+        # Reparse once typing pauses rather than on every keystroke
+        self.parse_timer = QTimer(self)
+        self.parse_timer.setSingleShot(True)
+        self.parse_timer.setInterval(150)
+        self.parse_timer.timeout.connect(self._parse_and_count)
         
         self.init_ui()
         
@@ -89,6 +119,7 @@ class DialogueEditorTab(QWidget):
         # Main editor area
         self.editor = DialogueTextEdit()
         self.editor.textChanged.connect(self.on_text_changed)
+        self.editor.document().contentsChange.connect(self._on_contents_change)
         self.editor.setFont(QFont("Courier", 11))
         layout.addWidget(self.editor, 1)
         
@@ -152,67 +183,96 @@ class DialogueEditorTab(QWidget):
     def on_text_changed(self) -> None:
         """Handle text change in editor."""
         self.mark_as_changed()
+        self.parse_timer.start()
+        
+    def _parse_and_count(self) -> None:
+        """Reparse the dialogue and recount characters after an edit."""
         self.update_character_count()
         self.parse_dialogue_from_text()
         
+    def _flush_parse(self) -> None:
+        """Apply a pending reparse now, before reading the dialogue lines."""
+        if self.parse_timer.isActive():
+            self.parse_timer.stop()
+            self._parse_and_count()
+            
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int) -> None:
+        """Reparse only the blocks an edit touched.
+        
+        Blocks before and after the edited range are unchanged, those after
+        it only shift by the change in block count.
+        """
+        document = self.editor.document()
+        first = document.findBlock(position)
+        last = document.findBlock(position + chars_added)
+        if not last.isValid():
+            last = document.lastBlock()
+        last_new = last.blockNumber()
+        last_old = last_new - (document.blockCount() - len(self._block_lines))
+        
+        parsed = []
+        block = first
+        while block.isValid() and block.blockNumber() <= last_new:
+            parsed.append(DialogueLine.parse(block.text()))
+            block = block.next()
+        self._block_lines[first.blockNumber():last_old + 1] = parsed
+        
     def update_character_count(self) -> None:
         """Update character count display."""
-        text = self.editor.toPlainText()
-        self.char_count_label.setText(f"{len(text)} characters")
+        # The document counts a final paragraph separator the text lacks
+        count = self.editor.document().characterCount() - 1
+        self.char_count_label.setText(f"{count} characters")
         
     def parse_dialogue_from_text(self) -> None:
         """Parse dialogue lines from editor text."""
-        text = self.editor.toPlainText()
-        lines = text.strip().split('\n')
-        
-        self.dialogue_lines.clear()
-        
-        for line in lines:
-            if ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    speaker = parts[0].strip()
-                    dialogue = parts[1].strip()
-                    if speaker and dialogue:
-                        self.dialogue_lines.append(DialogueLine(speaker, dialogue))
+        self._dialogue_cache = None
+        self.dialogue_lines = [line for line in self._block_lines if line is not None]
                         
     def update_dialogue_display(self) -> None:
         """Update the editor display with formatted dialogue."""
+        self._flush_parse()
         if not self.dialogue_lines:
             return
             
-        # Temporarily disconnect to avoid recursion
-        self.editor.textChanged.disconnect()
-        
         cursor_pos = self.editor.textCursor().position()
         
+        speaker_a = self.speaker_a_name.text()
+        speaker_b = self.speaker_b_name.text()
         text_parts = []
         for line in self.dialogue_lines:
             # Map generic speaker names to custom names
             speaker = line.speaker
-            if speaker in ["Speaker A", "Pro", "Reviewer", "Comedian A"]:
-                speaker = self.speaker_a_name.text()
-            elif speaker in ["Speaker B", "Con", "Author", "Comedian B"]:
-                speaker = self.speaker_b_name.text()
+            if speaker in SPEAKER_A_ALIASES:
+                speaker = speaker_a
+            elif speaker in SPEAKER_B_ALIASES:
+                speaker = speaker_b
                 
             text_parts.append(f"{speaker}: {line.text}")
             
-        self.editor.setPlainText('\n\n'.join(text_parts))
-        
-        # Restore cursor position
-        cursor = self.editor.textCursor()
-        cursor.setPosition(min(cursor_pos, len(self.editor.toPlainText())))
-        self.editor.setTextCursor(cursor)
-        
-        # Reconnect
-        self.editor.textChanged.connect(self.on_text_changed)
+        text = '\n\n'.join(text_parts)
+        
+        # Block the editor's signals to avoid recursion, they are unblocked
+        # again even if setting the text fails. The parsed blocks still
+        # follow the document. Painting waits until the cursor is restored
+        self.editor.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.editor):
+                self.editor.setPlainText(text)
+                
+                # Restore cursor position
+                cursor = self.editor.textCursor()
+                cursor.setPosition(min(cursor_pos, len(text)))
+                self.editor.setTextCursor(cursor)
+        finally:
+            self.editor.setUpdatesEnabled(True)
         
     def add_dialogue_line(self) -> None:
         """Add a new dialogue line."""
         # Determine current speaker
+        self._flush_parse()
         if self.dialogue_lines:
             last_speaker = self.dialogue_lines[-1].speaker
-            if last_speaker in [self.speaker_a_name.text(), "Speaker A", "Pro", "Reviewer", "Comedian A"]:
+            if last_speaker == self.speaker_a_name.text() or last_speaker in SPEAKER_A_ALIASES:
                 next_speaker = self.speaker_b_name.text()
             else:
                 next_speaker = self.speaker_a_name.text()
@@ -226,28 +286,26 @@ class DialogueEditorTab(QWidget):
         current_text += f"{next_speaker}: "
         
         self.editor.setPlainText(current_text)
-        self.editor.moveCursor(self.editor.textCursor().End)
+        self.editor.moveCursor(QTextCursor.MoveOperation.End)
         self.editor.setFocus()
         
     def switch_current_speaker(self) -> None:
         """Switch the current line's speaker."""
-        cursor = self.editor.textCursor()
-        cursor.select(cursor.SelectionType.LineUnderCursor)
-        line = cursor.selectedText()
-        
-        if ':' in line:
-            parts = line.split(':', 1)
-            current_speaker = parts[0].strip()
-            dialogue = parts[1].strip()
+        block = self.editor.textCursor().block()
+        colon = block.text().find(':')
+        if colon < 0:
+            return
             
-            # Switch speaker
-            if current_speaker == self.speaker_a_name.text():
-                new_speaker = self.speaker_b_name.text()
-            else:
-                new_speaker = self.speaker_a_name.text()
-                
-            # Replace line
-            cursor.insertText(f"{new_speaker}: {dialogue}")
+        # Switch speaker
+        if block.text()[:colon].strip() == self.speaker_a_name.text():
+            new_speaker = self.speaker_b_name.text()
+        else:
+            new_speaker = self.speaker_a_name.text()
+            
+        # Replace only the speaker name, leaving the dialogue untouched
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + colon, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(new_speaker)
             
     def format_dialogue(self) -> None:
         """Format dialogue with proper spacing."""
@@ -284,6 +342,7 @@ class DialogueEditorTab(QWidget):
             generated_lines = dialog.get_generated_dialogue()
             if generated_lines:
                 # Add generated lines
+                self._flush_parse()
                 for line in generated_lines:
                     self.dialogue_lines.append(line)
                 self.update_dialogue_display()
@@ -309,10 +368,12 @@ class DialogueEditorTab(QWidget):
         # Clear everything
         self.editor.clear()
         self.dialogue_lines.clear()
+        self._dialogue_cache = None
         self.current_project_id = None
         self.current_script_id = None
         self._has_unsaved_changes = False
         self.script_type_combo.setCurrentIndex(0)
+        self.dialogue_changed.emit()
         
     def save_dialogue(self) -> None:
         """Save current dialogue."""
@@ -322,8 +383,6 @@ class DialogueEditorTab(QWidget):
         
     def export_script(self) -> None:
         """Export dialogue as text file."""
-        from PyQt6.QtWidgets import QFileDialog
-        
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Export Script",
@@ -333,27 +392,41 @@ class DialogueEditorTab(QWidget):
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write(self.editor.toPlainText())
+                # Write block by block rather than copying the whole script
+                block = self.editor.document().firstBlock()
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.write(block.text())
+                    block = block.next()
+                    while block.isValid():
+                        f.write('\n')
+                        f.write(block.text())
+                        block = block.next()
                 QMessageBox.information(self, "Success", "Script exported successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export script: {e}")
                 
     def get_dialogue(self) -> Optional[Dict]:
         """Get current dialogue data."""
+        self._flush_parse()
         if not self.dialogue_lines:
             return None
+        if self._dialogue_cache is not None:
+            return self._dialogue_cache
             
-        return {
+        self._dialogue_cache = {
             "script_type": self.script_type_combo.currentText().lower().replace(' ', '_'),
             "speaker_a": self.speaker_a_name.text(),
             "speaker_b": self.speaker_b_name.text(),
             "lines": [line.to_dict() for line in self.dialogue_lines]
         }
+        return self._dialogue_cache
         
     def set_dialogue(self, dialogue_data: Dict) -> None:
         """Set dialogue from data."""
+        # The editor text is about to be replaced, drop its pending reparse
+        self.parse_timer.stop()
         self.dialogue_lines.clear()
+        self._dialogue_cache = None
         
         # Set script type
         script_type = dialogue_data.get("script_type", "dialogue")
@@ -372,10 +445,12 @@ class DialogueEditorTab(QWidget):
             
         self.update_dialogue_display()
         self._has_unsaved_changes = False
+        self.dialogue_changed.emit()
         
     def mark_as_changed(self) -> None:
         """Mark dialogue as having unsaved changes."""
         self._has_unsaved_changes = True
+        self._dialogue_cache = None
         self.dialogue_changed.emit()
         
     def has_unsaved_changes(self) -> bool:
@@ -393,14 +468,19 @@ class DialogueEditorTab(QWidget):
     def cleanup(self) -> None:
         """Clean up resources."""
         self.logger.info("Dialogue editor cleanup")
+        self.parse_timer.stop()
 
 
-class DialogueTextEdit(QTextEdit):
-    """Custom text editor for dialogue with syntax highlighting."""
+class DialogueTextEdit(QPlainTextEdit):
+    """Custom text editor for dialogue with syntax highlighting.
+    
+    Scripts are plain text, so this builds on QPlainTextEdit, whose line
+    based layout stays fast on long scripts where QTextEdit lays out rich
+    text.
+    """
     
     def __init__(self):
         super().__init__()
-        self.setAcceptRichText(False)
         
         
 # Import QLineEdit that was missing
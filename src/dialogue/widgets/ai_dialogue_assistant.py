@@ -15,7 +15,6 @@ from PyQt6.QtWidgets import (
     QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTextEdit,
     QVBoxLayout,
 )
 
@@ -23,6 +22,49 @@ from src.dialogue.tabs.dialogue_editor import DialogueLine
 from src.gui.services import APIService
 
 
+# LLM prompts by script type, filled in with str.format
+PROMPT_TEMPLATES = {
+    "Debate": """Generate a debate between two speakers on the topic: {topic}
+Speaker A ({speaker_a}) argues FOR the topic.
+Speaker B ({speaker_b}) argues AGAINST the topic.
+Tone: {tone}
+Number of exchanges: {exchanges}
+
+Format each line as:
+SPEAKER_NAME: Their dialogue
+
+Example:
+{speaker_a}: I believe that {topic} is essential because...
+{speaker_b}: I respectfully disagree. The evidence shows...""",
+    "Comedy Sketch": """Generate a funny comedy sketch between two comedians about: {topic}
+Speaker A: {speaker_a}
+Speaker B: {speaker_b}
+Tone: {tone} comedy
+Number of exchanges: {exchanges}
+
+Make it humorous with jokes, puns, and comedic timing.
+Format each line as:
+SPEAKER_NAME: Their dialogue""",
+    "Blog Review": """Generate a conversation where {speaker_a} reviews a blog post about: {topic}
+{speaker_b} is the blog author responding to questions and feedback.
+Tone: {tone}
+Number of exchanges: {exchanges}
+
+Format each line as:
+SPEAKER_NAME: Their dialogue""",
+}
+
+# Prompt for regular dialogue
+DEFAULT_PROMPT_TEMPLATE = """Generate a natural conversation between two people about: {topic}
+Speaker A: {speaker_a}
+Speaker B: {speaker_b}
+Tone: {tone}
+Number of exchanges: {exchanges}
+
+Format each line as:
+SPEAKER_NAME: Their dialogue"""
+
+
 class AIDialogueAssistant(QDialog):
     """AI assistant for generating dialogue."""
     
@@ -99,7 +141,7 @@ class AIDialogueAssistant(QDialog):
         preview_group = QGroupBox("Generated Dialogue Preview")
         preview_layout = QVBoxLayout(preview_group)
         
-        self.preview_text = QTextEdit()
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
         preview_layout.addWidget(self.preview_text)
         
@@ -122,50 +164,15 @@ class AIDialogueAssistant(QDialog):
             return
             
         # Build prompt based on script type
-        if self.script_type == "Debate":
-            prompt = f"""Generate a debate between two speakers on the topic: {topic}
-Speaker A ({self.speaker_a}) argues FOR the topic.
-Speaker B ({self.speaker_b}) argues AGAINST the topic.
-Tone: {self.tone_combo.currentText()}
-Number of exchanges: {self.exchanges_spin.value()}
-
-Format each line as:
-SPEAKER_NAME: Their dialogue
-
-Example:
-{self.speaker_a}: I believe that {topic} is essential because...
-{self.speaker_b}: I respectfully disagree. The evidence shows..."""
-
-        elif self.script_type == "Comedy Sketch":
-            prompt = f"""Generate a funny comedy sketch between two comedians about: {topic}
-Speaker A: {self.speaker_a}
-Speaker B: {self.speaker_b}
-Tone: {self.tone_combo.currentText()} comedy
-Number of exchanges: {self.exchanges_spin.value()}
-
-Make it humorous with jokes, puns, and comedic timing.
-Format each line as:
-SPEAKER_NAME: Their dialogue"""
-
-        elif self.script_type == "Blog Review":
-            prompt = f"""Generate a conversation where {self.speaker_a} reviews a blog post about: {topic}
-{self.speaker_b} is the blog author responding to questions and feedback.
-Tone: {self.tone_combo.currentText()}
-Number of exchanges: {self.exchanges_spin.value()}
-
-Format each line as:
-SPEAKER_NAME: Their dialogue"""
-
-        else:  # Regular dialogue
-            prompt = f"""Generate a natural conversation between two people about: {topic}
-Speaker A: {self.speaker_a}
-Speaker B: {self.speaker_b}
-Tone: {self.tone_combo.currentText()}
-Number of exchanges: {self.exchanges_spin.value()}
-
-Format each line as:
-SPEAKER_NAME: Their dialogue"""
-
+        template = PROMPT_TEMPLATES.get(self.script_type, DEFAULT_PROMPT_TEMPLATE)
+        prompt = template.format(
+            topic=topic,
+            speaker_a=self.speaker_a,
+            speaker_b=self.speaker_b,
+            tone=self.tone_combo.currentText(),
+            exchanges=self.exchanges_spin.value(),
+        )
+        
         # Show generating status
         self.preview_text.setPlainText("Generating dialogue... Please wait...")
         self.generate_btn.setEnabled(False)
@@ -214,11 +221,9 @@ SPEAKER_NAME: Their dialogue"""
         
     def update_preview(self) -> None:
         """Update the preview display."""
-        text_parts = []
-        for line in self.generated_lines:
-            text_parts.append(f"{line.speaker}: {line.text}")
-            
-        self.preview_text.setPlainText('\n\n'.join(text_parts))
+        self.preview_text.setPlainText(
+            '\n\n'.join(f"{line.speaker}: {line.text}" for line in self.generated_lines)
+        )
         
     def get_generated_dialogue(self) -> List[DialogueLine]:
         """Get the generated dialogue lines."""
@@ -2,11 +2,12 @@
 
 import asyncio
 import logging
-from typing import Optional
+from concurrent.futures import Future
+from typing import Callable, Optional
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
-from src.api.client import APIClient
+from src.api.client import APIClient, get_api_client
 from src.utils.config import get_settings
 
 
@@ -58,8 +59,8 @@ class APIService(QObject):
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         
-        # Create API client
-        self.client = APIClient()
+        # Use the shared API client so its connection pool is reused
+        self.client = get_api_client()
         
         # Check connection
         self._loop.run_until_complete(self._check_connection())
@@ -94,11 +95,27 @@ class APIService(QObject):
             # Don't emit error signal on initial connection attempt
             # This allows the app to run in offline mode
             
-    def run_async(self, coro):
-        """Run an async coroutine and return a future."""
+    def run_async(
+        self,
+        coro,
+        on_done: Optional[Callable[[Future], None]] = None,
+        parent: Optional[QObject] = None,
+    ):
+        """Run an async coroutine and return a future.
+        
+        Args:
+            coro: Coroutine to run on the service's event loop
+            on_done: Called with the future on the GUI thread once it is
+                done, instead of the caller polling it
+            parent: GUI object the callback belongs to, no callback is made
+                once it has been deleted
+        """
         if not self._loop:
             raise RuntimeError("API service not started")
-        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        if on_done is not None:
+            FutureWatcher(future, on_done, parent)
+        return future
         
     async def _periodic_connection_check(self):
         """Periodically check API connection status."""
@@ -108,6 +125,27 @@ class APIService(QObject):
                 await self._check_connection()
 
 
+class FutureWatcher(QObject):
+    """Hand a future from the service's thread back to the GUI thread."""
+    
+    done = pyqtSignal(object)
+    
+    def __init__(self, future: Future, callback: Callable[[Future], None], parent: Optional[QObject]):
+        """Call back with the future, on this object's thread, once it is done."""
+        super().__init__(parent)
+        self.done.connect(callback)
+        self.done.connect(self.deleteLater)
+        future.add_done_callback(self._emit_done)
+        
+    def _emit_done(self, future: Future) -> None:
+        """Queue the callback, runs on the thread that finished the future."""
+        try:
+            self.done.emit(future)
+        except RuntimeError:
+            # The parent and this watcher were deleted while it ran
+            pass
+            
+            
 # Global API service instance
 _api_service: Optional[APIService] = None
 
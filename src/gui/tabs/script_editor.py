@@ -1,7 +1,8 @@
 """Script Editor tab for creating and editing scripts."""
 
-import asyncio
 import logging
+import shutil
+from pathlib import Path
 from typing import Optional, Dict
 from datetime import datetime
 
@@ -574,15 +575,15 @@ class ScriptEditorTab(QWidget):
                         parameters=parameters
                     )
                     
-                    # Poll for completion
+                    # Long-poll for completion, one request per status change
                     while job["status"] in ["pending", "processing"]:
-                        await asyncio.sleep(1)
-                        job = await self.api_service.client.check_tts_status(job["job_id"])
+                        job = await self.api_service.client.wait_tts_status(job["job_id"])
                         
                     if job["status"] == "completed":
-                        # Download the audio file
-                        audio_data = await self.api_service.client.download_tts_audio(job["job_id"])
-                        return audio_data, job.get("file_path")
+                        # Stream the audio to a temp file until the user picks a location
+                        temp_path = Path(self.api_service.settings.temp_dir) / f"{job['job_id']}.wav"
+                        await self.api_service.client.download_tts_audio(job["job_id"], temp_path)
+                        return temp_path, job.get("file_path")
                     else:
                         raise Exception(f"Generation failed: {job.get('error', 'Unknown error')}")
                         
@@ -595,7 +596,7 @@ class ScriptEditorTab(QWidget):
             def check_result():
                 if future.done():
                     try:
-                        audio_data, file_path = future.result()
+                        temp_path, file_path = future.result()
                         self.editor_status.setText("Speech generated successfully")
                         
                         # Ask user where to save
@@ -606,9 +607,10 @@ class ScriptEditorTab(QWidget):
                             "Audio Files (*.wav *.mp3);;All Files (*.*)"
                         )
                         
-                        if filename:
-                            with open(filename, 'wb') as f:
-                                f.write(audio_data)
+                        if not filename:
+                            temp_path.unlink(missing_ok=True)
+                        else:
+                            shutil.move(temp_path, filename)
                             self.editor_status.setText(f"Audio saved: {filename}")
                             
                             # Offer to play the audio
@@ -1059,7 +1061,7 @@ class TTSGenerationDialog(QDialog):
         pitch_layout = QHBoxLayout()
         pitch_layout.addWidget(self.pitch_slider)
         pitch_layout.addWidget(self.pitch_label)
-        self.pitch_slider.valueChanged.connect(lambda v: self.pitch_label.setText(str(v)))
+        self.pitch_slider.valueChanged.connect(self.pitch_label.setNum)
         params_layout.addRow("Pitch:", pitch_layout)
         
         # Emotion
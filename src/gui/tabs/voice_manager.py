@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -31,6 +31,8 @@ from src.utils.config import get_settings
 class VoiceManagerTab(QWidget):
     """Tab for managing voice profiles and recordings."""
 
+    voices_changed = pyqtSignal()  # Voice profiles were reloaded or cloned
+
     def __init__(self) -> None:
         """Initialize the Voice Manager tab."""
         super().__init__()
@@ -630,6 +632,7 @@ class VoiceManagerTab(QWidget):
         
     def on_voice_profiles_loaded(self, profiles) -> None:
         """Handle loaded voice profiles."""
+        self.voices_changed.emit()
         self.voice_list.clear()
         
         if not profiles:
@@ -753,6 +756,7 @@ class VoiceManagerTab(QWidget):
                                 # Update voice profile
                                 if voice_id in self.voice_profiles:
                                     self.voice_profiles[voice_id].is_cloned = True
+                                self.voices_changed.emit()
                                     
                             elif status["status"] == "failed":
                                 error = status.get("error", "Unknown error")
@@ -797,17 +801,17 @@ class VoiceManagerTab(QWidget):
         async def generate_test():
             try:
                 # Use the quick generation endpoint - returns binary audio
-                # Must use form data, not JSON
-                response = await self.api_service.client.client.post(
+                session = await self.api_service.client.get_session()
+                async with session.post(
                     "/api/tts/generate/quick",
-                    data={
+                    json={
                         "text": text,
-                        "voice_profile_id": str(voice_id)  # Form data needs string
+                        "voice_profile_id": voice_id
                     }
-                )
-                response.raise_for_status()
-                # Get binary audio data
-                audio_data = response.content
+                ) as response:
+                    response.raise_for_status()
+                    # Get binary audio data
+                    audio_data = await response.read()
                 # Save to temporary file
                 temp_path = self.settings.temp_dir / f"test_voice_{voice_id}.wav"
                 temp_path.parent.mkdir(parents=True, exist_ok=True)
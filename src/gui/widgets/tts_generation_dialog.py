@@ -138,7 +138,7 @@ class TTSGenerationDialog(QDialog):
         self.pitch_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.pitch_slider.setTickInterval(10)
         self.pitch_label = QLabel("0")
-        self.pitch_slider.valueChanged.connect(lambda v: self.pitch_label.setText(str(v)))
+        self.pitch_slider.valueChanged.connect(self.pitch_label.setNum)
         pitch_layout = QHBoxLayout()
         pitch_layout.addWidget(self.pitch_slider)
         pitch_layout.addWidget(self.pitch_label)
@@ -240,7 +240,11 @@ class TTSGenerationDialog(QDialog):
         
     async def _load_voices(self) -> List[VoiceProfileResponse]:
         """Load voices asynchronously."""
-        return await self.api_service.client.list_voice_profiles()
+        # The client's session lives on the API service loop, so run the call
+        # there and await it from this worker's loop
+        return await asyncio.wrap_future(
+            self.api_service.run_async(self.api_service.client.list_voice_profiles())
+        )
         
     def _on_voices_loaded(self, voices: List[VoiceProfileResponse]) -> None:
         """Handle loaded voices."""
@@ -407,9 +411,9 @@ class TTSGenerationDialog(QDialog):
             
             response = requests.post(
                 url,
-                data={
+                json={
                     "text": text,
-                    "voice_profile_id": str(self.selected_voice_id)
+                    "voice_profile_id": self.selected_voice_id
                 },
                 timeout=timeout_seconds
             )
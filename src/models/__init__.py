@@ -0,0 +1,29 @@
+"""Database models and utilities."""
+
+from src.models.crud import audio_output, script, voice_profile
+from src.models.database import (
+    AudioOutput,
+    Base,
+    Script,
+    VoiceProfile,
+    get_db,
+    get_engine,
+    get_session_factory,
+    init_db,
+    reset_db,
+)
+
+__all__ = [
+    "Base",
+    "VoiceProfile",
+    "Script",
+    "AudioOutput",
+    "get_engine",
+    "get_session_factory",
+    "get_db",
+    "init_db",
+    "reset_db",
+    "voice_profile",
+    "script",
+    "audio_output",
+]
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""CRUD operations for database models."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from sqlalchemy import delete, func, literal_column, select, text
+from sqlalchemy.orm import Session
+
+from src.models.database import AudioOutput, Base, Script, VoiceProfile, has_search_index
+
+# Generic type for database models
+ModelType = TypeVar("ModelType", bound=Base)
+
+
+class CRUDBase:
+    """Base class for CRUD operations."""
+
+    def __init__(self, model: Type[ModelType]):
+        """Initialize with model class."""
+        self.model = model
+
+    def get(self, db: Session, id: int) -> Optional[ModelType]:
+        """Get a single record by ID."""
+        return db.query(self.model).filter(self.model.id == id).first()
+
+    def get_multi(
+        self, db: Session, *, skip: int = 0, limit: int = 100, with_total: bool = False
+    ) -> Union[List[ModelType], Tuple[List[ModelType], int]]:
+        """Get multiple records with pagination.
+
+        With ``with_total=True`` returns ``(rows, total)``, counting all
+        records in the same query.
+        """
+        if with_total:
+            return self._paginate(db, skip=skip, limit=limit)
+        return db.query(self.model).order_by(self.model.id).offset(skip).limit(limit).all()
+
+    def count(self, db: Session) -> int:
+        """Count all records."""
+        return db.query(func.count(self.model.id)).scalar()
+
+    def _paginate(
+        self, db: Session, *criteria: Any, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[ModelType], int]:
+        """Get one page of records matching criteria and the total match count.
+
+        The total comes from a ``count(*) OVER ()`` window in the same query.
+        """
+        rows = (
+            db.query(self.model, func.count().over().label("total"))
+            .filter(*criteria)
+            .order_by(self.model.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # Past the last page the window has no rows to report a total on
+        total = 0
+        if skip:
+            total = db.query(func.count(self.model.id)).filter(*criteria).scalar()
+        return [], total
+
+    def create(self, db: Session, *, obj_in: Dict[str, Any]) -> ModelType:
+        """Create a new record."""
+        db_obj = self.model(**obj_in)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(
+        self, db: Session, *, db_obj: ModelType, obj_in: Dict[str, Any]
+    ) -> ModelType:
+        """Update an existing record."""
+        for field, value in obj_in.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+        
+        # Update the updated_at timestamp if it exists
+        if hasattr(db_obj, "updated_at"):
+            db_obj.updated_at = datetime.utcnow()
+        
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def delete(self, db: Session, *, id: int) -> Optional[ModelType]:
+        """Delete a record."""
+        obj = self.get(db, id)
+        if obj:
+            db.delete(obj)
+            db.commit()
+        return obj
+
+
+class CRUDVoiceProfile(CRUDBase):
+    """CRUD operations for VoiceProfile model."""
+
+    def get_by_name(self, db: Session, *, name: str) -> Optional[VoiceProfile]:
+        """Get voice profile by name."""
+        return db.query(VoiceProfile).filter(VoiceProfile.name == name).first()
+
+    def get_all_with_outputs(self, db: Session) -> List[VoiceProfile]:
+        """Get all voice profiles with their audio outputs."""
+        return db.query(VoiceProfile).all()
+
+    def update_parameters(
+        self, db: Session, *, id: int, parameters: Dict[str, Any]
+    ) -> Optional[VoiceProfile]:
+        """Update voice profile parameters."""
+        voice_profile = self.get(db, id)
+        if voice_profile:
+            # Merge new parameters with existing ones
+            current_params = voice_profile.parameters or {}
+            current_params.update(parameters)
+            return self.update(db, db_obj=voice_profile, obj_in={"parameters": current_params})
+        return None
+
+
+class CRUDScript(CRUDBase):
+    """CRUD operations for Script model."""
+
+    def get_by_title(self, db: Session, *, title: str) -> Optional[Script]:
+        """Get script by title."""
+        return db.query(Script).filter(Script.title == title).first()
+
+    def get_versions(self, db: Session, *, parent_id: int) -> List[Script]:
+        """Get all versions of a script."""
+        return db.query(Script).filter(Script.parent_id == parent_id).all()
+
+    def delete_versions(self, db: Session, *, parent_id: int) -> int:
+        """Delete all versions of a script in one statement.
+
+        Bulk deletes skip the ORM cascade, so the versions' audio outputs are
+        deleted explicitly in the same transaction.
+
+        Returns:
+            Number of versions deleted
+        """
+        version_ids = select(Script.id).where(Script.parent_id == parent_id)
+        db.execute(delete(AudioOutput).where(AudioOutput.script_id.in_(version_ids)))
+        result = db.execute(delete(Script).where(Script.parent_id == parent_id))
+        db.commit()
+        return result.rowcount
+
+    def create_version(
+        self, db: Session, *, script_id: int, content: str
+    ) -> Optional[Script]:
+        """Create a new version of an existing script."""
+        original = self.get(db, script_id)
+        if not original:
+            return None
+
+        # Get the latest version number
+        versions = self.get_versions(db, parent_id=original.parent_id or original.id)
+        latest_version = max([v.version for v in versions] + [original.version])
+
+        # Create new version
+        new_version = {
+            "title": original.title,
+            "content": content,
+            "version": latest_version + 1,
+            "parent_id": original.parent_id or original.id,
+        }
+        return self.create(db, obj_in=new_version)
+
+    def search(
+        self, db: Session, *, query: str, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Script], int]:
+        """Search scripts by title or content.
+
+        Returns one page of matches and the total match count.
+        """
+        condition = self._search_condition(db, query)
+        return self._paginate(db, condition, skip=skip, limit=limit)
+
+    def _search_condition(self, db: Session, query: str) -> Any:
+        """Build a search filter that uses the full-text index when possible."""
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            document = func.to_tsvector(
+                "english",
+                func.coalesce(Script.title, "") + " " + func.coalesce(Script.content, ""),
+            )
+            return document.op("@@")(func.plainto_tsquery("english", query))
+
+        # The trigram index needs at least three characters to match on, and
+        # is missing on SQLite builds without trigram support
+        if dialect == "sqlite" and len(query) >= 3 and has_search_index(db.connection()):
+            phrase = '"' + query.replace('"', '""') + '"'
+            matches = (
+                select(literal_column("rowid"))
+                .select_from(text("scripts_fts"))
+                .where(text("scripts_fts MATCH :phrase").bindparams(phrase=phrase))
+            )
+            return Script.id.in_(matches)
+
+        search_filter = f"%{query}%"
+        return (Script.title.like(search_filter)) | (
+            Script.content.like(search_filter)
+        )
+
+
+class CRUDAudioOutput(CRUDBase):
+    """CRUD operations for AudioOutput model."""
+
+    def get_by_script(self, db: Session, *, script_id: int) -> List[AudioOutput]:
+        """Get all audio outputs for a script."""
+        return db.query(AudioOutput).filter(AudioOutput.script_id == script_id).all()
+
+    def get_by_voice_profile(
+        self, db: Session, *, voice_profile_id: int
+    ) -> List[AudioOutput]:
+        """Get all audio outputs for a voice profile."""
+        return (
+            db.query(AudioOutput)
+            .filter(AudioOutput.voice_profile_id == voice_profile_id)
+            .all()
+        )
+
+    def get_recent(self, db: Session, *, limit: int = 10) -> List[AudioOutput]:
+        """Get recent audio outputs."""
+        return (
+            db.query(AudioOutput)
+            .order_by(AudioOutput.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+
+# Create instances for each model
+voice_profile = CRUDVoiceProfile(VoiceProfile)
+script = CRUDScript(Script)
+audio_output = CRUDAudioOutput(AudioOutput)
\ No newline at end of file
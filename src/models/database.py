@@ -0,0 +1,323 @@
+"""Database models and connection management for ChatterBloke."""
+
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    create_engine,
+    event,
+    make_url,
+    text,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Create base class for declarative models
+Base = declarative_base()
+
+
+class VoiceProfile(Base):
+    """Voice profile model for storing cloned voice information."""
+
+    __tablename__ = "voice_profiles"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255), nullable=False, unique=True)
+    description = Column(String(500))
+    audio_file_path = Column(String(500))
+    model_path = Column(String(500))
+    is_cloned = Column(Boolean, default=False)
+    parameters = Column(JSON, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    audio_outputs = relationship(
+        "AudioOutput", back_populates="voice_profile", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<VoiceProfile(id={self.id}, name='{self.name}')>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "audio_file_path": self.audio_file_path,
+            "model_path": self.model_path,
+            "is_cloned": self.is_cloned,
+            "parameters": self.parameters,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class Script(Base):
+    """Script model for storing text content."""
+
+    __tablename__ = "scripts"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(255), nullable=False)
+    content = Column(String)  # SQLite stores as TEXT
+    version = Column(Integer, default=1)
+    parent_id = Column(Integer, ForeignKey("scripts.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    audio_outputs = relationship(
+        "AudioOutput", back_populates="script", cascade="all, delete-orphan"
+    )
+    parent = relationship("Script", remote_side=[id], backref="versions")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<Script(id={self.id}, title='{self.title}', version={self.version})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "content": self.content,
+            "version": self.version,
+            "parent_id": self.parent_id,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+# Full-text index for script search. On SQLite an FTS5 trigram table mirrors
+# the scripts table through triggers, which keeps substring matching while
+# using an index. On PostgreSQL a GIN index covers the tsvector expression.
+SCRIPTS_FTS_SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS scripts_fts USING fts5(
+        title, content, content='scripts', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS scripts_fts_insert AFTER INSERT ON scripts BEGIN
+        INSERT INTO scripts_fts(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS scripts_fts_delete AFTER DELETE ON scripts BEGIN
+        INSERT INTO scripts_fts(scripts_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS scripts_fts_update AFTER UPDATE ON scripts BEGIN
+        INSERT INTO scripts_fts(scripts_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO scripts_fts(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END""",
+]
+SCRIPTS_FTS_POSTGRESQL_DDL = [
+    """CREATE INDEX IF NOT EXISTS ix_scripts_fts ON scripts USING gin (
+        to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))
+    )""",
+]
+
+
+def has_search_index(connection) -> bool:
+    """Check whether the SQLite full-text index for script search exists."""
+    # Only a positive answer is remembered, dropping the index forgets it
+    if connection.info.get("scripts_fts"):
+        return True
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = 'scripts_fts'")
+    ).first() is not None
+    connection.info["scripts_fts"] = exists
+    return exists
+
+
+def _has_search_triggers(connection) -> bool:
+    """Check whether all triggers keeping the SQLite index current exist."""
+    count = connection.execute(
+        text(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN "
+            "('scripts_fts_insert', 'scripts_fts_delete', 'scripts_fts_update')"
+        )
+    ).scalar()
+    return count == 3
+
+
+def create_search_index(connection) -> None:
+    """Create the full-text index used by script search if it is missing.
+    
+    SQLite builds without FTS5 or older than 3.34, which added the trigram
+    tokenizer, get no index and search falls back to LIKE.
+    """
+    if connection.dialect.name == "sqlite":
+        # The triggers go with the scripts table, so an index outliving a
+        # dropped table is reattached and rebuilt
+        if has_search_index(connection) and _has_search_triggers(connection):
+            return
+        if sqlite3.sqlite_version_info < (3, 34, 0):
+            logger.warning(
+                f"SQLite {sqlite3.sqlite_version} lacks the FTS5 trigram tokenizer, "
+                "script search will not be indexed"
+            )
+            return
+        try:
+            connection.execute(text(SCRIPTS_FTS_SQLITE_DDL[0]))
+        except OperationalError as e:
+            logger.warning(f"Script search will not be indexed: {e}")
+            return
+        for statement in SCRIPTS_FTS_SQLITE_DDL[1:]:
+            connection.execute(text(statement))
+        # Index any scripts that existed before the index or its triggers
+        connection.execute(text("INSERT INTO scripts_fts(scripts_fts) VALUES ('rebuild')"))
+        connection.info["scripts_fts"] = True
+    elif connection.dialect.name == "postgresql":
+        for statement in SCRIPTS_FTS_POSTGRESQL_DDL:
+            connection.execute(text(statement))
+
+
+@event.listens_for(Script.__table__, "after_create")
+def _create_search_index(target, connection, **kw) -> None:
+    """Create the search index alongside a newly created scripts table."""
+    create_search_index(connection)
+
+
+@event.listens_for(Script.__table__, "after_drop")
+def _drop_search_index(target, connection, **kw) -> None:
+    """Drop the SQLite search index, which the metadata does not know of."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS scripts_fts"))
+        connection.info.pop("scripts_fts", None)
+
+
+class AudioOutput(Base):
+    """Audio output model for storing generated speech files."""
+
+    __tablename__ = "audio_outputs"
+
+    id = Column(Integer, primary_key=True)
+    script_id = Column(Integer, ForeignKey("scripts.id"), nullable=False)
+    voice_profile_id = Column(Integer, ForeignKey("voice_profiles.id"), nullable=False)
+    file_path = Column(String(500), nullable=False)
+    parameters = Column(JSON, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    script = relationship("Script", back_populates="audio_outputs")
+    voice_profile = relationship("VoiceProfile", back_populates="audio_outputs")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<AudioOutput(id={self.id}, script_id={self.script_id}, voice_profile_id={self.voice_profile_id})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.id,
+            "script_id": self.script_id,
+            "voice_profile_id": self.voice_profile_id,
+            "file_path": self.file_path,
+            "parameters": self.parameters,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+# Database connection management
+_engine: Optional[Any] = None
+_SessionLocal: Optional[sessionmaker] = None
+
+
+def get_engine():
+    """Get or create database engine."""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        url = make_url(settings.database_url)
+        if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            # An in-memory database only exists within its one connection,
+            # so every session must share it
+            engine_args = {
+                "connect_args": {"check_same_thread": False},
+                "poolclass": StaticPool,
+            }
+        elif url.get_backend_name() == "sqlite":
+            # Sync handlers run concurrently in the API threadpool, so each
+            # gets a pooled connection of its own, and with it a transaction
+            # of its own. Connections move between threads with the pool
+            engine_args = {
+                "connect_args": {"check_same_thread": False},
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
+            }
+        else:
+            # Size the pool for the API threadpool, check connections before
+            # use and reuse the most recent ones so idle extras can time out
+            engine_args = {
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
+                "pool_pre_ping": True,
+                "pool_recycle": 1800,
+                "pool_use_lifo": True,
+            }
+        
+        _engine = create_engine(
+            settings.database_url,
+            echo=settings.debug,
+            **engine_args,
+        )
+    return _engine
+
+
+def get_session_factory() -> sessionmaker:
+    """Get or create session factory."""
+    global _SessionLocal
+    if _SessionLocal is None:
+        # Objects stay loaded after commit so responses can be serialized
+        # without another round-trip per object
+        _SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine()
+        )
+    return _SessionLocal
+
+
+def get_db():
+    """Get database session for dependency injection."""
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def init_db() -> None:
+    """Initialize database tables."""
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    # Databases created before the search index existed get it here
+    with engine.begin() as connection:
+        create_search_index(connection)
+
+
+def reset_db() -> None:
+    """Reset database (useful for testing)."""
+    global _engine, _SessionLocal
+    if _engine is not None:
+        Base.metadata.drop_all(bind=_engine)
+        _engine.dispose()
+    _engine = None
+    _SessionLocal = None
\ No newline at end of file
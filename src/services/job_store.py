@@ -0,0 +1,271 @@
+"""Storage for TTS job metadata shared between API handlers and workers."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional, Union
+
+import orjson
+
+from src.utils.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+# Jobs in these states are no longer tracked as active
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class MemoryJobStore:
+    """In-process job store, used when no Redis URL is configured.
+
+    Only valid for a single API process. Jobs expire ``ttl`` seconds after
+    their last update so finished jobs do not accumulate.
+    """
+
+    def __init__(self, ttl: int = 3600):
+        """Initialize the store.
+
+        Args:
+            ttl: Seconds a job is kept after its last update
+        """
+        self.ttl = ttl
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._expires: Dict[str, float] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._locks: Dict[str, float] = {}
+
+    def _evict_expired(self) -> None:
+        """Drop jobs whose TTL has passed."""
+        now = time.monotonic()
+        for job_id in [j for j, expires in self._expires.items() if expires <= now]:
+            self._jobs.pop(job_id, None)
+            self._expires.pop(job_id, None)
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Create a job record."""
+        self._evict_expired()
+        self._jobs[job_id] = dict(fields)
+        self._expires[job_id] = time.monotonic() + self.ttl
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of a job record, refresh its TTL and wake up waiters."""
+        job = self._jobs.setdefault(job_id, {})
+        job.update(fields)
+        self._expires[job_id] = time.monotonic() + self.ttl
+        event = self._changed.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record, or None if it is unknown or expired."""
+        self._evict_expired()
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    async def get_many(self, job_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several job records, skipping unknown ones."""
+        self._evict_expired()
+        return {
+            job_id: dict(self._jobs[job_id])
+            for job_id in job_ids
+            if job_id in self._jobs
+        }
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Get the work queue, creating it in the running event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        """Queue a job envelope for a worker."""
+        self._get_queue().put_nowait(job)
+
+    async def dequeue(self) -> Dict[str, Any]:
+        """Wait for the next queued job envelope."""
+        return await self._get_queue().get()
+
+    async def wait_for_update(
+        self, job_id: str, seen: Dict[str, Any], timeout: float
+    ) -> None:
+        """Wait up to ``timeout`` seconds for a job to change.
+        
+        Args:
+            job_id: Job to wait for
+            seen: Job record the caller already has
+            timeout: Seconds to wait
+        """
+        if await self.get(job_id) != seen:
+            return
+        event = self._changed.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def acquire_lock(self, name: str, ttl: int) -> bool:
+        """Take a named lock for ``ttl`` seconds, False if it is already held."""
+        now = time.monotonic()
+        if self._locks.get(name, 0) > now:
+            return False
+        self._locks[name] = now + ttl
+        return True
+
+    async def release_lock(self, name: str) -> None:
+        """Release a named lock."""
+        self._locks.pop(name, None)
+
+    async def close(self) -> None:
+        """Release resources (nothing to do for the memory store)."""
+
+
+class RedisJobStore:
+    """Job store backed by Redis hashes, shared by all API and worker processes.
+
+    Each job is a hash at ``tts:job:{job_id}`` whose field values are JSON
+    encoded, so reads return the same types that were written. Unfinished
+    jobs are also members of the ``tts:jobs:active`` set. Job envelopes are
+    queued on the ``tts:queue`` list and every update is published on
+    ``tts:status:{job_id}``.
+    """
+
+    KEY_PREFIX = "tts:job:"
+    ACTIVE_KEY = "tts:jobs:active"
+    QUEUE_KEY = "tts:queue"
+    STATUS_CHANNEL_PREFIX = "tts:status:"
+
+    def __init__(self, redis_url: str, ttl: int = 3600):
+        """Initialize the store.
+
+        Args:
+            redis_url: Redis connection URL
+            ttl: Seconds a job is kept after its last update
+        """
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(redis_url)
+        self.ttl = ttl
+
+    def _key(self, job_id: str) -> str:
+        """Get the hash key for a job."""
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, bytes]:
+        """Encode field values for storage in a hash."""
+        return {name: orjson.dumps(value) for name, value in fields.items()}
+
+    @staticmethod
+    def _decode(raw: Dict[bytes, bytes]) -> Dict[str, Any]:
+        """Decode a stored hash back into a job dict."""
+        return {name.decode(): orjson.loads(value) for name, value in raw.items()}
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Create a job record."""
+        key = self._key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl)
+            pipe.sadd(self.ACTIVE_KEY, job_id)
+            await pipe.execute()
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of a job record, refresh its TTL and publish the change.
+        
+        All of it goes to Redis as one pipelined transaction.
+        """
+        key = self._key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl)
+            if fields.get("status") in TERMINAL_STATUSES:
+                pipe.srem(self.ACTIVE_KEY, job_id)
+            pipe.publish(f"{self.STATUS_CHANNEL_PREFIX}{job_id}", orjson.dumps(fields))
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record, or None if it is unknown or expired."""
+        raw = await self.redis.hgetall(self._key(job_id))
+        return self._decode(raw) if raw else None
+
+    async def get_many(self, job_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several job records in one round-trip, skipping unknown ones."""
+        job_ids = list(job_ids)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(self._key(job_id))
+            results = await pipe.execute()
+        return {
+            job_id: self._decode(raw)
+            for job_id, raw in zip(job_ids, results)
+            if raw
+        }
+
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        """Queue a job envelope for a worker process."""
+        await self.redis.lpush(self.QUEUE_KEY, orjson.dumps(job))
+
+    async def dequeue(self) -> Dict[str, Any]:
+        """Block until a job envelope is available and pop it."""
+        _, raw = await self.redis.brpop(self.QUEUE_KEY, timeout=0)
+        return orjson.loads(raw)
+
+    async def wait_for_update(
+        self, job_id: str, seen: Dict[str, Any], timeout: float
+    ) -> None:
+        """Wait up to ``timeout`` seconds for a job to change.
+        
+        Args:
+            job_id: Job to wait for
+            seen: Job record the caller already has
+            timeout: Seconds to wait
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        async with self.redis.pubsub() as pubsub:
+            await pubsub.subscribe(f"{self.STATUS_CHANNEL_PREFIX}{job_id}")
+            # The job may have changed before the subscription was in place
+            if await self.get(job_id) != seen:
+                return
+            while (remaining := deadline - loop.time()) > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is not None:
+                    return
+
+    async def acquire_lock(self, name: str, ttl: int) -> bool:
+        """Take a named lock for ``ttl`` seconds, False if it is already held."""
+        return bool(await self.redis.set(name, b"1", nx=True, ex=ttl))
+
+    async def release_lock(self, name: str) -> None:
+        """Release a named lock."""
+        await self.redis.delete(name)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis.aclose()
+
+
+JobStore = Union[MemoryJobStore, RedisJobStore]
+
+# Global job store instance
+_job_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """Get or create the global job store.
+
+    Uses Redis when ``REDIS_URL`` is set, otherwise an in-process store.
+    """
+    global _job_store
+    if _job_store is None:
+        settings = get_settings()
+        if settings.redis_url:
+            logger.info("Using Redis job store")
+            _job_store = RedisJobStore(settings.redis_url, ttl=settings.tts_job_ttl)
+        else:
+            _job_store = MemoryJobStore(ttl=settings.tts_job_ttl)
+    return _job_store
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import httpx
 
 from src.utils.config import get_settings
@@ -28,6 +28,16 @@ class OllamaService:
         """Close the HTTP client."""
         await self.client.aclose()
         
+    async def ping(self) -> bool:
+        """Check that Ollama is reachable, opening a pooled connection."""
+        try:
+            response = await self.client.get("/api/tags")
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning(f"Ollama not reachable at {self.base_url}: {e}")
+            return False
+            
     async def list_models(self) -> List[str]:
         """List available models from Ollama."""
         try:
@@ -91,8 +101,12 @@ class OllamaService:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
-    ) -> str:
-        """Generate a script based on prompt and type."""
+    ) -> Tuple[str, int]:
+        """Generate a script based on prompt and type.
+        
+        Returns:
+            Tuple of (script text, tokens generated as reported by Ollama)
+        """
         # Create a system prompt based on script type
         system_prompts = {
             "general": "You are a professional scriptwriter. Create engaging, well-structured scripts.",
@@ -125,7 +139,7 @@ Script:"""
             system_prompt=system_prompt,
         )
         
-        return result["response"].strip()
+        return result["response"].strip(), result["eval_count"]
         
     async def improve_script(
         self,
@@ -133,8 +147,12 @@ Script:"""
         instructions: str,
         model: Optional[str] = None,
         temperature: float = 0.7,
-    ) -> str:
-        """Improve an existing script based on instructions."""
+    ) -> Tuple[str, int]:
+        """Improve an existing script based on instructions.
+        
+        Returns:
+            Tuple of (improved script, tokens generated as reported by Ollama)
+        """
         system_prompt = "You are a professional script editor. Improve scripts while maintaining their core message."
         
         prompt = f"""Please improve the following script based on these instructions:
@@ -153,7 +171,7 @@ Improved Script:"""
             system_prompt=system_prompt,
         )
         
-        return result["response"].strip()
+        return result["response"].strip(), result["eval_count"]
         
     async def check_grammar(
         self,
@@ -3,12 +3,17 @@
 import asyncio
 import logging
 import os
+import re
+import threading
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from uuid import uuid4
 
 import numpy as np
+import soundfile as sf
 
 # Try to import torch/torchaudio, but provide fallback
 try:
@@ -35,6 +40,9 @@ class TTSService:
         self.device = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
         self.executor = ThreadPoolExecutor(max_workers=2)
         self._initialized = False
+        # Voice prompt the model's conditionals were last prepared from
+        self._model_lock = threading.Lock()
+        self._prepared_prompt: Optional[Tuple[str, int]] = None
         
         # Job tracking
         self.active_jobs: Dict[str, Dict] = {}
@@ -131,10 +139,6 @@ class TTSService:
             if progress_callback:
                 await progress_callback(10, "Loading audio file...")
                 
-            # Verify audio file
-            if not audio_path.exists():
-                raise FileNotFoundError(f"Audio file not found: {audio_path}")
-                
             # Update progress
             self.active_jobs[job_id]["progress"] = 30
             if progress_callback:
@@ -215,7 +219,6 @@ class TTSService:
             
             if len(text) > MAX_CHUNK_LENGTH:
                 # Split text into sentences first, then chunks
-                import re
                 sentences = re.split(r'(?<=[.!?])\s+', text)
                 chunks = []
                 current_chunk = ""
@@ -264,8 +267,7 @@ class TTSService:
                         gen_kwargs["audio_prompt_path"] = audio_prompt_path
                         
                     chunk_wav = await loop.run_in_executor(
-                        self.executor,
-                        lambda c=chunk, k=gen_kwargs: self.model.generate(**k)
+                        self.executor, self._generate_wav, gen_kwargs
                     )
                     wav_chunks.append(chunk_wav)
                 
@@ -293,16 +295,19 @@ class TTSService:
                 
                 # Add small silence between chunks (0.1 second)
                 silence_samples = int(self.model.sr * 0.1)
-                silence = np.zeros(silence_samples)
-                
-                # Concatenate with silence between chunks
-                wav_with_pauses = []
-                for i, chunk in enumerate(processed_chunks):
-                    wav_with_pauses.append(chunk)
-                    if i < len(processed_chunks) - 1:
-                        wav_with_pauses.append(silence)
                 
-                wav = np.concatenate(wav_with_pauses)
+                # Copy the chunks into one zeroed float32 buffer, the gaps left
+                # between them are the silence. Concatenating with float64
+                # silence arrays upcast the whole clip to twice the memory
+                total_samples = (
+                    sum(len(chunk) for chunk in processed_chunks)
+                    + silence_samples * (len(processed_chunks) - 1)
+                )
+                wav = np.zeros(total_samples, dtype=np.float32)
+                position = 0
+                for chunk in processed_chunks:
+                    wav[position:position + len(chunk)] = chunk
+                    position += len(chunk) + silence_samples
                 
             else:
                 # Text is short enough, generate normally
@@ -322,8 +327,7 @@ class TTSService:
                     
                 # Generate audio
                 wav = await loop.run_in_executor(
-                    self.executor,
-                    lambda: self.model.generate(**gen_kwargs)
+                    self.executor, self._generate_wav, gen_kwargs
                 )
             
             # Apply speed adjustment if needed
@@ -349,6 +353,31 @@ class TTSService:
             logger.error(f"Speech generation failed: {e}")
             raise
             
+    def _generate_wav(self, gen_kwargs: Dict):
+        """Run the model, conditioning on the voice prompt only when it changed.
+        
+        The model keeps the conditionals from the last prompt it prepared, so
+        consecutive lines in the same voice skip re-encoding the prompt audio.
+        Generation is serialized because those conditionals are shared state.
+        
+        Args:
+            gen_kwargs: Keyword arguments for the model's generate()
+        """
+        gen_kwargs = dict(gen_kwargs)
+        audio_prompt_path = gen_kwargs.pop("audio_prompt_path", None)
+        with self._model_lock:
+            if audio_prompt_path:
+                # A re-recorded sample at the same path must be re-encoded
+                prompt = (audio_prompt_path, os.stat(audio_prompt_path).st_mtime_ns)
+                if prompt != self._prepared_prompt:
+                    self._prepared_prompt = None
+                    self.model.prepare_conditionals(
+                        audio_prompt_path,
+                        exaggeration=gen_kwargs.get("exaggeration", 0.5),
+                    )
+                    self._prepared_prompt = prompt
+            return self.model.generate(**gen_kwargs)
+            
     def _adjust_speed(self, audio, speed: float):
         """Adjust audio playback speed."""
         if not TORCH_AVAILABLE or speed == 1.0:
@@ -422,16 +451,21 @@ class TTSService:
             if audio_tensor.ndim == 1:
                 audio_tensor = audio_tensor.unsqueeze(0)
                 
+            # 16-bit PCM like the quick endpoint, torchaudio would otherwise
+            # write the float32 samples at twice the size
             await loop.run_in_executor(
                 self.executor,
-                torchaudio.save,
-                str(output_path),
-                audio_tensor,
-                sample_rate
+                partial(
+                    torchaudio.save,
+                    str(output_path),
+                    audio_tensor,
+                    sample_rate,
+                    encoding="PCM_S",
+                    bits_per_sample=16,
+                ),
             )
         else:
             # Use soundfile as fallback
-            import soundfile as sf
             await loop.run_in_executor(
                 self.executor,
                 sf.write,
@@ -462,6 +496,3 @@ def get_tts_service() -> TTSService:
     if _tts_service is None:
         _tts_service = TTSService()
     return _tts_service
-
-
-from datetime import datetime
\ No newline at end of file
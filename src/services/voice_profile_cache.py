@@ -0,0 +1,127 @@
+"""Read-through cache for voice profiles."""
+
+import logging
+from typing import Optional
+
+import orjson
+from sqlalchemy.orm import Session
+
+from src.api.models import VoiceProfileResponse
+from src.models import crud
+from src.utils.cache import SimpleCache
+from src.utils.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceProfileCache:
+    """Cache voice profiles, which every TTS request reads but rarely change.
+
+    Profiles are stored as Redis hashes at ``voice:profile:{id}`` when
+    ``REDIS_URL`` is set, so all API and worker processes share them, and in
+    process memory otherwise. The number of profiles is cached alongside at
+    ``voice:profile:count``. Callers must invalidate a profile after
+    changing it, and the count after creating or deleting one.
+    """
+
+    KEY_PREFIX = "voice:profile:"
+    COUNT_KEY = "voice:profile:count"
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 300):
+        """Initialize the cache.
+
+        Args:
+            redis_url: Redis connection URL, or None for a local cache
+            ttl: Seconds a profile stays cached
+        """
+        self.ttl = ttl
+        self.redis = None
+        self._local = SimpleCache(default_ttl=ttl)
+        if redis_url:
+            import redis
+
+            self.redis = redis.Redis.from_url(redis_url)
+
+    def _key(self, voice_id: int) -> str:
+        """Get the cache key for a voice profile."""
+        return f"{self.KEY_PREFIX}{voice_id}"
+
+    def _load(self, voice_id: int) -> Optional[VoiceProfileResponse]:
+        """Get a cached profile, or None on a miss."""
+        if self.redis is None:
+            return self._local.get(self._key(voice_id))
+        raw = self.redis.hgetall(self._key(voice_id))
+        if not raw:
+            return None
+        return VoiceProfileResponse.model_validate(
+            {name.decode(): orjson.loads(value) for name, value in raw.items()}
+        )
+
+    def _store(self, profile: VoiceProfileResponse) -> None:
+        """Cache a profile for ``ttl`` seconds."""
+        key = self._key(profile.id)
+        if self.redis is None:
+            self._local.set(key, profile, self.ttl)
+            return
+        fields = profile.model_dump(mode="json")
+        with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={name: orjson.dumps(value) for name, value in fields.items()})
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+
+    def get(self, db: Session, voice_id: int) -> Optional[VoiceProfileResponse]:
+        """Get a voice profile, loading it from the database on a miss."""
+        profile = self._load(voice_id)
+        if profile is not None:
+            return profile
+
+        voice_profile = crud.voice_profile.get(db, id=voice_id)
+        if voice_profile is None:
+            return None
+        profile = VoiceProfileResponse.model_validate(voice_profile)
+        self._store(profile)
+        return profile
+
+    def count(self, db: Session) -> int:
+        """Get the number of voice profiles, counting them on a miss."""
+        if self.redis is None:
+            total = self._local.get(self.COUNT_KEY)
+        else:
+            total = self.redis.get(self.COUNT_KEY)
+        if total is not None:
+            return int(total)
+
+        total = crud.voice_profile.count(db)
+        if self.redis is None:
+            self._local.set(self.COUNT_KEY, total, self.ttl)
+        else:
+            self.redis.set(self.COUNT_KEY, total, ex=self.ttl)
+        return total
+
+    def invalidate_count(self) -> None:
+        """Drop the cached number of voice profiles."""
+        if self.redis is None:
+            self._local.invalidate(self.COUNT_KEY)
+        else:
+            self.redis.delete(self.COUNT_KEY)
+
+    def invalidate(self, voice_id: int) -> None:
+        """Drop a voice profile from the cache."""
+        if self.redis is None:
+            self._local.invalidate(self._key(voice_id))
+        else:
+            self.redis.delete(self._key(voice_id))
+
+
+# Global voice profile cache instance
+_voice_profile_cache: Optional[VoiceProfileCache] = None
+
+
+def get_voice_profile_cache() -> VoiceProfileCache:
+    """Get or create the global voice profile cache."""
+    global _voice_profile_cache
+    if _voice_profile_cache is None:
+        _voice_profile_cache = VoiceProfileCache(get_settings().redis_url)
+    return _voice_profile_cache
@@ -3,7 +3,6 @@
 import io
 import logging
 import queue
-import tempfile
 import threading
 import time
 import wave
@@ -241,6 +240,9 @@ class AudioRecorder:
 class AudioPlayer:
     """Simple audio player for WAV files."""
     
+    # Frames decoded and written to the output stream at a time
+    BLOCK_FRAMES = 4096
+    
     def __init__(self):
         """Initialize audio player."""
         self.logger = logging.getLogger(__name__)
@@ -260,74 +262,66 @@ class AudioPlayer:
             self.logger.warning("Already playing audio")
             return False
             
-        try:
-            # Handle file path or bytes
-            if isinstance(audio_data, str):
-                # It's a file path
-                tmp_path = audio_data
-                cleanup_tmp = False
-            else:
-                # It's bytes data - save to temporary file
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                    tmp_file.write(audio_data)
-                    tmp_path = tmp_file.name
-                cleanup_tmp = True
-                
-            # Play using available method
-            if SOUNDDEVICE_AVAILABLE and SOUNDFILE_AVAILABLE and sd is not None and sf is not None:
-                return self._play_sounddevice(tmp_path)
-            else:
-                # Could add pygame or other fallback methods here
-                self.logger.error("No audio playback library available")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Playback error: {e}")
+        # Play using available method
+        if SOUNDDEVICE_AVAILABLE and SOUNDFILE_AVAILABLE and sd is not None and sf is not None:
+            # Bytes are read in place rather than copied to a temporary file
+            source = audio_data if isinstance(audio_data, str) else io.BytesIO(audio_data)
+            return self._play_sounddevice(source)
+        else:
+            # Could add pygame or other fallback methods here
+            self.logger.error("No audio playback library available")
             return False
-        finally:
-            # Clean up temp file if we created one
-            if 'cleanup_tmp' in locals() and cleanup_tmp and 'tmp_path' in locals():
-                try:
-                    Path(tmp_path).unlink()
-                except:
-                    pass
-                    
-    def _play_sounddevice(self, file_path: str) -> bool:
+            
+    def _play_sounddevice(self, source: Union[str, io.BytesIO]) -> bool:
         """Play audio using sounddevice.
         
+        The file is streamed to the output device a block at a time, so it
+        is never decoded into memory as a whole.
+        
         Args:
-            file_path: Path to WAV file
+            source: Path to WAV file, or a file object holding one
             
         Returns:
             True if playback started successfully
         """
         try:
-            data, sample_rate = sf.read(file_path)
-            
-            self.is_playing = True
-            self.stop_flag.clear()
-            
-            def play_thread():
-                try:
-                    sd.play(data, sample_rate)
-                    sd.wait()  # Wait until playback is done
-                except Exception as e:
-                    self.logger.error(f"Playback error: {e}")
-                finally:
-                    self.is_playing = False
-                    
-            threading.Thread(target=play_thread).start()
-            return True
-            
+            audio_file = sf.SoundFile(source)
         except Exception as e:
             self.logger.error(f"Failed to play audio: {e}")
-            self.is_playing = False
             return False
             
+        # Each playback gets its own flag, so a stopped one finishing late
+        # cannot mark a newer one as done
+        stop_flag = threading.Event()
+        self.stop_flag = stop_flag
+        self.is_playing = True
+        
+        def play_thread():
+            try:
+                with audio_file, sd.OutputStream(
+                    samplerate=audio_file.samplerate,
+                    channels=audio_file.channels,
+                    dtype="float32",
+                ) as stream:
+                    for block in audio_file.blocks(
+                        self.BLOCK_FRAMES, dtype="float32", always_2d=True
+                    ):
+                        if stop_flag.is_set():
+                            break
+                        stream.write(block)
+            except Exception as e:
+                self.logger.error(f"Playback error: {e}")
+            finally:
+                if self.stop_flag is stop_flag:
+                    self.is_playing = False
+                    
+        threading.Thread(target=play_thread, daemon=True).start()
+        return True
+        
     def stop(self) -> None:
         """Stop playback."""
-        if self.is_playing and SOUNDDEVICE_AVAILABLE and sd is not None:
-            sd.stop()
+        if self.is_playing:
+            self.stop_flag.set()
             self.is_playing = False
             
 
@@ -1,11 +1,17 @@
-"""Simple in-memory cache for performance optimization."""
+"""Simple caches for performance optimization."""
 
+import hashlib
+import os
 import time
+from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 
 class SimpleCache:
-    """Simple time-based in-memory cache."""
+    """Simple time-based in-memory cache.
+    
+    Safe to share between threads, every access is a single dict operation.
+    """
     
     def __init__(self, default_ttl: int = 300):
         """Initialize cache.
@@ -18,13 +24,14 @@ class SimpleCache:
         
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
-        if key in self.cache:
-            value, expiry = self.cache[key]
+        entry = self.cache.get(key)
+        if entry is not None:
+            value, expiry = entry
             if time.time() < expiry:
                 return value
             else:
                 # Expired, remove it
-                del self.cache[key]
+                self.cache.pop(key, None)
         return None
         
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -35,8 +42,7 @@ class SimpleCache:
         
     def invalidate(self, key: str) -> None:
         """Remove key from cache."""
-        if key in self.cache:
-            del self.cache[key]
+        self.cache.pop(key, None)
             
     def clear(self) -> None:
         """Clear all cache entries."""
@@ -46,14 +52,92 @@ class SimpleCache:
         """Remove all expired entries."""
         current_time = time.time()
         expired_keys = [
-            key for key, (_, expiry) in self.cache.items()
+            key for key, (_, expiry) in list(self.cache.items())
             if current_time >= expiry
         ]
         for key in expired_keys:
-            del self.cache[key]
+            self.cache.pop(key, None)
+
+
+class DiskCache:
+    """Size-capped on-disk cache of byte blobs, evicting least recently used.
+    
+    Entries are files named by a hash of their key. Reading an entry touches
+    its modification time, so pruning removes the longest unused first.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int = 512 * 1024 * 1024, suffix: str = ""):
+        """Initialize cache.
+        
+        Args:
+            directory: Directory holding the cached files
+            max_bytes: Total size the cache is pruned back to
+            suffix: File extension for cached files
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        
+    def _path(self, key: str) -> Path:
+        """Get the file holding a key."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.directory / f"{digest}{self.suffix}"
+        
+    def __contains__(self, key: str) -> bool:
+        """Check for a key without reading it or marking it used."""
+        return self._path(key).exists()
+        
+    def get(self, key: str) -> Optional[bytes]:
+        """Get cached bytes, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+        
+    def set(self, key: str, data: bytes) -> None:
+        """Cache bytes, pruning old entries if the cache grew too large."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # Write then rename so readers never see a partial file
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        self.prune()
+        
+    def prune(self) -> None:
+        """Delete least recently used entries until under the size cap."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
+                
+    def clear(self) -> None:
+        """Delete all cached files."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
 
 
 # Global caches for different data types
-script_cache = SimpleCache(ttl=600)  # 10 minutes for scripts
-voice_cache = SimpleCache(ttl=300)   # 5 minutes for voice profiles
-model_cache = SimpleCache(ttl=3600)  # 1 hour for LLM models
\ No newline at end of file
+script_cache = SimpleCache(default_ttl=600)  # 10 minutes for scripts
+voice_cache = SimpleCache(default_ttl=300)   # 5 minutes for voice profiles
+model_cache = SimpleCache(default_ttl=3600)  # 1 hour for LLM models
\ No newline at end of file
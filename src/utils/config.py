@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="sqlite:///data/chatterbloke.db", env="DATABASE_URL"
     )
+    database_pool_size: int = Field(default=20, env="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=40, env="DATABASE_MAX_OVERFLOW")
 
     # Audio Settings
     audio_sample_rate: int = Field(default=44100, env="AUDIO_SAMPLE_RATE")
@@ -41,6 +43,9 @@ class Settings(BaseSettings):
     api_host: str = Field(default="127.0.0.1", env="API_HOST")
     api_port: int = Field(default=8000, env="API_PORT")
     api_reload: bool = Field(default=False, env="API_RELOAD")
+    cors_origins: List[str] = Field(
+        default=["http://localhost:3000"], env="CORS_ORIGINS"
+    )
 
     # Ollama Settings
     ollama_host: str = Field(default="http://localhost:11434", env="OLLAMA_HOST")
@@ -51,6 +56,12 @@ class Settings(BaseSettings):
     tts_default_speed: float = Field(default=1.0, env="TTS_DEFAULT_SPEED")
     tts_default_pitch: float = Field(default=1.0, env="TTS_DEFAULT_PITCH")
     tts_queue_size: int = Field(default=10, env="TTS_QUEUE_SIZE")
+    tts_job_ttl: int = Field(default=3600, env="TTS_JOB_TTL")
+    # The server runs the model one call at a time, more only queue there
+    tts_concurrent_requests: int = Field(default=1, env="TTS_CONCURRENT_REQUESTS")
+
+    # Redis Settings (optional, needed to run more than one API worker)
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
     
     # Chatterbox Model Settings
     chatterbox_model_path: Optional[Path] = Field(default=None, env="CHATTERBOX_MODEL_PATH")
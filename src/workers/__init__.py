@@ -0,0 +1 @@
+"""Background workers."""
@@ -0,0 +1,116 @@
+"""TTS worker that processes queued speech generation jobs.
+
+Without Redis the API runs this worker inside its own event loop. With
+``REDIS_URL`` set, run one or more worker processes next to the API:
+
+    python -m src.workers.tts_worker
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from src.models import get_session_factory, init_db
+from src.services.job_store import JobStore, get_job_store
+from src.services.tts_service import get_tts_service
+from src.services.voice_profile_cache import get_voice_profile_cache
+from src.utils.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def _load_voice(voice_id: int) -> Tuple[int, Optional[str]]:
+    """Get the ID and prompt audio path of a job's voice profile."""
+    with get_session_factory()() as db:
+        voice_profile = get_voice_profile_cache().get(db, voice_id)
+        if not voice_profile:
+            raise ValueError("Voice profile not found")
+        return voice_profile.id, voice_profile.audio_file_path or None
+
+
+async def process_tts_job(job: Dict[str, Any], jobs: JobStore) -> None:
+    """Generate speech for one queued job and record the result.
+
+    Args:
+        job: Job envelope with job_id, text, voice_id and parameters
+        jobs: Job store to report progress to
+    """
+    job_id = job["job_id"]
+    try:
+        await jobs.update(job_id, status="processing", progress=20)
+
+        # Look up the voice here, the envelope only carries its ID. Off the
+        # event loop, since a cache miss queries the database
+        voice_profile_id, audio_prompt_path = await run_in_threadpool(
+            _load_voice, job["voice_id"]
+        )
+
+        # Generate speech
+        tts_service = get_tts_service()
+        params = job.get("parameters") or {}
+        audio_array, sample_rate = await tts_service.generate_speech(
+            text=job["text"],
+            voice_profile_id=voice_profile_id,
+            audio_prompt_path=audio_prompt_path,
+            speed=params.get("speed", 1.0),
+            pitch=params.get("pitch", 1.0),
+            emotion=params.get("emotion", "neutral"),
+            exaggeration=params.get("exaggeration", 0.5),
+            cfg_weight=params.get("cfg_weight", 0.5)
+        )
+
+        # Save output
+        output_path = await tts_service.save_output(
+            audio_array=audio_array,
+            sample_rate=sample_rate,
+            script_id=job.get("script_id") or 0,
+            voice_profile_id=voice_profile_id,
+            format="wav"
+        )
+
+        # Record the result and notify waiters in a single store write
+        await jobs.update(
+            job_id,
+            status="completed",
+            progress=100,
+            result_url=f"/outputs/{output_path.name}",
+            output_path=str(output_path),
+        )
+
+        logger.info(f"TTS generation completed for job {job_id}")
+
+    except Exception as e:
+        logger.error(f"TTS generation failed for job {job_id}: {e}")
+        await jobs.update(job_id, status="failed", error=str(e))
+
+
+async def run_worker(jobs: JobStore) -> None:
+    """Process queued TTS jobs one at a time until cancelled."""
+    logger.info("TTS worker started")
+    while True:
+        job = await jobs.dequeue()
+        await process_tts_job(job, jobs)
+
+
+def main() -> None:
+    """Run a standalone TTS worker against the Redis queue."""
+    settings = get_settings()
+
+    # Configure logging
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    if not settings.redis_url:
+        raise SystemExit("REDIS_URL must be set to run a separate TTS worker")
+
+    init_db()
+    asyncio.run(run_worker(get_job_store()))
+
+
+if __name__ == "__main__":
+    main()
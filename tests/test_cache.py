@@ -0,0 +1,59 @@
+"""Tests for the on-disk cache."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.utils.cache import DiskCache, SimpleCache
+
+
+class TestDiskCache:
+    """Test the size-capped on-disk cache."""
+
+    def test_get_and_set(self, tmp_path: Path):
+        """Test cached bytes are returned until cleared."""
+        cache = DiskCache(tmp_path / "cache", suffix=".wav")
+        assert cache.get("line") is None
+
+        cache.set("line", b"audio")
+        assert "line" in cache
+        assert "other line" not in cache
+        assert cache.get("line") == b"audio"
+        assert cache.get("other line") is None
+
+        cache.clear()
+        assert cache.get("line") is None
+
+    def test_prunes_least_recently_used(self, tmp_path: Path):
+        """Test the longest unused entry is evicted past the size cap."""
+        cache = DiskCache(tmp_path, max_bytes=10)
+        cache.set("old", b"12345")
+        cache.set("recent", b"12345")
+
+        # Make "old" the least recently used, then read "recent" again
+        os.utime(cache._path("old"), (0, 0))
+        os.utime(cache._path("recent"), (1, 1))
+        assert cache.get("recent") == b"12345"
+
+        cache.set("new", b"12345")
+        assert cache.get("old") is None
+        assert cache.get("recent") == b"12345"
+        assert cache.get("new") == b"12345"
+
+
+class TestSimpleCache:
+    """Test the in-memory TTL cache."""
+
+    def test_concurrent_invalidate(self):
+        """Test threads invalidating and reading the same key never raise."""
+        cache = SimpleCache(default_ttl=300)
+
+        def churn():
+            for _ in range(2000):
+                cache.set("voice", 1)
+                cache.invalidate("voice")
+                cache.get("voice")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(churn) for _ in range(4)]:
+                future.result()
@@ -20,6 +20,7 @@ class TestSettings:
         assert settings.debug is False
         assert settings.log_level == "INFO"
         assert settings.database_url == "sqlite:///data/chatterbloke.db"
+        assert settings.cors_origins == ["http://localhost:3000"]
 
     def test_settings_from_env(self, monkeypatch):
         """Test loading settings from environment variables."""
@@ -0,0 +1,75 @@
+"""Tests for the dialogue editor tab."""
+
+import random
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QApplication
+
+from src.dialogue.tabs.dialogue_editor import DialogueEditorTab, DialogueLine
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication for testing."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+def parsed(lines):
+    """Get comparable (speaker, text) pairs for dialogue lines."""
+    return [(line.speaker, line.text) for line in lines]
+
+
+class TestDialogueEditor:
+    """Test dialogue parsing in the editor."""
+
+    def test_parse_line(self):
+        """Test only "Speaker: text" lines with both parts are dialogue."""
+        line = DialogueLine.parse("  Pro : Taxes: too high ")
+        assert (line.speaker, line.text) == ("Pro", "Taxes: too high")
+        assert DialogueLine.parse("no speaker here") is None
+        assert DialogueLine.parse("Speaker A:   ") is None
+        assert DialogueLine.parse(": orphan text") is None
+
+    def test_incremental_parse_matches_full_parse(self, qapp):
+        """Test parsing only edited blocks agrees with reparsing everything."""
+        tab = DialogueEditorTab(MagicMock())
+        editor = tab.editor
+        editor.setPlainText("Speaker A: Hello\n\nSpeaker B: Hi there")
+
+        rng = random.Random(0)
+        inserts = ["", "\n", "\n\n", "x", ":", "Speaker A: ", "one\nSpeaker B: two"]
+        for _ in range(500):
+            text = editor.toPlainText()
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + rng.choice([0, 1, 5, 20])))
+            cursor = editor.textCursor()
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(rng.choice(inserts))
+            if rng.random() < 0.1:
+                editor.undo()
+
+            expected = [DialogueLine.parse(line) for line in editor.toPlainText().split("\n")]
+            tab.parse_dialogue_from_text()
+            assert parsed(tab.dialogue_lines) == parsed(line for line in expected if line)
+
+        tab.update_character_count()
+        assert tab.char_count_label.text() == f"{len(editor.toPlainText())} characters"
+
+    def test_get_dialogue_cached_until_changed(self, qapp):
+        """Test the dialogue is serialized again only after an edit."""
+        tab = DialogueEditorTab(MagicMock())
+        tab.editor.setPlainText("Speaker A: Hello")
+
+        dialogue = tab.get_dialogue()
+        assert dialogue["lines"] == [{"speaker": "Speaker A", "text": "Hello"}]
+        assert tab.get_dialogue() is dialogue
+
+        tab.editor.appendPlainText("Speaker B: Hi")
+        assert tab.get_dialogue()["lines"][-1] == {"speaker": "Speaker B", "text": "Hi"}
@@ -0,0 +1,81 @@
+"""Tests for the TTS job store."""
+
+import asyncio
+
+import pytest
+
+from src.services.job_store import MemoryJobStore
+
+
+class TestMemoryJobStore:
+    """Test the in-process job store."""
+
+    @pytest.mark.asyncio
+    async def test_create_update_get(self):
+        """Test that updates merge into the stored job."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "processing", "progress": 0})
+        await store.update("job-1", progress=80)
+        
+        job = await store.get("job-1")
+        assert job == {"status": "processing", "progress": 80}
+        assert await store.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_unknown(self):
+        """Test fetching several jobs at once."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "completed"})
+        
+        jobs = await store.get_many(["job-1", "missing"])
+        assert list(jobs) == ["job-1"]
+
+    @pytest.mark.asyncio
+    async def test_jobs_expire(self):
+        """Test that jobs are dropped once their TTL passes."""
+        store = MemoryJobStore(ttl=0)
+        await store.create("job-1", {"status": "completed"})
+        
+        assert await store.get("job-1") is None
+
+    @pytest.mark.asyncio
+    async def test_queue_is_fifo(self):
+        """Test that queued job envelopes come out in order."""
+        store = MemoryJobStore()
+        await store.enqueue({"job_id": "job-1"})
+        await store.enqueue({"job_id": "job-2"})
+        
+        assert (await store.dequeue())["job_id"] == "job-1"
+        assert (await store.dequeue())["job_id"] == "job-2"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_update_wakes_on_update(self):
+        """Test that waiters are released when a job changes."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "processing", "progress": 20})
+        seen = await store.get("job-1")
+        waiter = asyncio.create_task(store.wait_for_update("job-1", seen, timeout=5))
+        await asyncio.sleep(0)
+        
+        await store.update("job-1", status="completed", progress=100)
+        await asyncio.wait_for(waiter, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_update_returns_if_already_changed(self):
+        """Test that a stale caller does not wait for the next change."""
+        store = MemoryJobStore()
+        await store.create("job-1", {"status": "processing", "progress": 20})
+        
+        await asyncio.wait_for(
+            store.wait_for_update("job-1", {"status": "pending"}, timeout=5), timeout=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_lock_is_exclusive_until_released(self):
+        """Test that a named lock can only be held once."""
+        store = MemoryJobStore()
+        assert await store.acquire_lock("clone:lock:1", ttl=60)
+        assert not await store.acquire_lock("clone:lock:1", ttl=60)
+        
+        await store.release_lock("clone:lock:1")
+        assert await store.acquire_lock("clone:lock:1", ttl=60)
@@ -1,10 +1,14 @@
 """Tests for database models."""
 
+import sqlite3
+
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.models import crud
-from src.models.database import AudioOutput, Script, VoiceProfile
+from src.models.database import AudioOutput, Base, Script, VoiceProfile, has_search_index
 
 
 class TestVoiceProfile:
@@ -146,6 +150,17 @@ class TestScript:
         assert len(versions) == 2  # v2 and v3
         assert all(v.parent_id == original.id for v in versions)
 
+    def test_delete_script_versions(self, test_db: Session, sample_script_data: dict):
+        """Test deleting all versions of a script at once."""
+        original = crud.script.create(db=test_db, obj_in=sample_script_data)
+        crud.script.create_version(db=test_db, script_id=original.id, content="v2")
+        crud.script.create_version(db=test_db, script_id=original.id, content="v3")
+        
+        deleted = crud.script.delete_versions(db=test_db, parent_id=original.id)
+        assert deleted == 2
+        assert crud.script.get_versions(db=test_db, parent_id=original.id) == []
+        assert crud.script.get(db=test_db, id=original.id) is not None
+
     def test_search_scripts(self, test_db: Session):
         """Test searching scripts by title or content."""
         # Create multiple scripts
@@ -159,12 +174,90 @@ class TestScript:
             crud.script.create(db=test_db, obj_in=data)
         
         # Search by title
-        results = crud.script.search(db=test_db, query="Python")
+        results, total = crud.script.search(db=test_db, query="Python")
         assert len(results) == 2
+        assert total == 2
         
         # Search by content
-        results = crud.script.search(db=test_db, query="JavaScript")
+        results, total = crud.script.search(db=test_db, query="JavaScript")
         assert len(results) == 1
+        assert total == 1
+
+    def test_search_scripts_tracks_updates(self, test_db: Session):
+        """Test that search matches substrings and follows content edits."""
+        script = crud.script.create(
+            db=test_db, obj_in={"title": "Indexed", "content": "Quokka facts"}
+        )
+        
+        results, _ = crud.script.search(db=test_db, query="okka fa")
+        assert [s.id for s in results] == [script.id]
+        
+        crud.script.update(db=test_db, db_obj=script, obj_in={"content": "Wombat facts"})
+        results, _ = crud.script.search(db=test_db, query="quokka")
+        assert results == []
+        results, _ = crud.script.search(db=test_db, query="wombat")
+        assert [s.id for s in results] == [script.id]
+
+    def test_search_scripts_paginated(self, test_db: Session):
+        """Test that search pages in SQL and still reports the full total."""
+        for i in range(5):
+            crud.script.create(
+                db=test_db, obj_in={"title": f"Paged {i}", "content": "content"}
+            )
+        
+        results, total = crud.script.search(db=test_db, query="Paged", skip=1, limit=2)
+        assert [s.title for s in results] == ["Paged 1", "Paged 2"]
+        assert total == 5
+        
+        # Past the last page the total is still reported
+        results, total = crud.script.search(db=test_db, query="Paged", skip=10, limit=2)
+        assert results == []
+        assert total == 5
+
+    def test_search_without_trigram_support(self, monkeypatch):
+        """Test that SQLite without the trigram tokenizer searches with LIKE."""
+        monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 31, 1))
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            assert not has_search_index(db.connection())
+            script = crud.script.create(
+                db=db, obj_in={"title": "Unindexed", "content": "Quokka facts"}
+            )
+            results, total = crud.script.search(db=db, query="okka fa")
+            assert [s.id for s in results] == [script.id]
+            assert total == 1
+        engine.dispose()
+
+    def test_search_after_tables_recreated(self, tmp_path):
+        """Test that dropping and recreating the tables keeps search indexed."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+        Base.metadata.create_all(bind=engine)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            script = crud.script.create(
+                db=db, obj_in={"title": "Recreated", "content": "Wombat facts"}
+            )
+            results, total = crud.script.search(db=db, query="wombat")
+            assert [s.id for s in results] == [script.id]
+            assert total == 1
+        engine.dispose()
+
+    def test_get_multi_with_total(self, test_db: Session):
+        """Test that get_multi can return a page with the overall total."""
+        for i in range(3):
+            crud.script.create(
+                db=test_db, obj_in={"title": f"Counted {i}", "content": "content"}
+            )
+        
+        results, total = crud.script.get_multi(db=test_db, limit=2, with_total=True)
+        assert len(results) == 2
+        assert total == test_db.query(Script).count()
 
 
 class TestAudioOutput:
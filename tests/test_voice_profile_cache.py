@@ -0,0 +1,44 @@
+"""Tests for the voice profile cache."""
+
+from sqlalchemy.orm import Session
+
+from src.models import crud
+from src.services.voice_profile_cache import VoiceProfileCache
+
+
+class TestVoiceProfileCache:
+    """Test the in-process voice profile cache."""
+
+    def test_get_reads_through(self, test_db: Session):
+        """Test a miss loads the profile and later hits skip the database."""
+        cache = VoiceProfileCache()
+        voice = crud.voice_profile.create(
+            db=test_db, obj_in={"name": "Cached Voice", "parameters": {"speed": 1.0}}
+        )
+
+        profile = cache.get(test_db, voice.id)
+        assert profile is not None
+        assert profile.name == "Cached Voice"
+
+        # Change the row behind the cache's back
+        crud.voice_profile.update(db=test_db, db_obj=voice, obj_in={"name": "Renamed Voice"})
+        assert cache.get(test_db, voice.id).name == "Cached Voice"
+
+        cache.invalidate(voice.id)
+        assert cache.get(test_db, voice.id).name == "Renamed Voice"
+
+    def test_get_missing(self, test_db: Session):
+        """Test an unknown profile is not cached."""
+        cache = VoiceProfileCache()
+        assert cache.get(test_db, 999999) is None
+
+    def test_count_until_invalidated(self, test_db: Session):
+        """Test the profile count is cached until invalidated."""
+        cache = VoiceProfileCache()
+        total = cache.count(test_db)
+
+        crud.voice_profile.create(db=test_db, obj_in={"name": "Counted Voice"})
+        assert cache.count(test_db) == total
+
+        cache.invalidate_count()
+        assert cache.count(test_db) == total + 1